@@ -22,17 +22,21 @@ DEFAULT_USE_GPS = True
 
 # Settings
 
-TRACKING_DOMAINS = [
-    str(Platform.DEVICE_TRACKER),
-    str("person"),
-    str(Platform.SENSOR),
-    "variable",
-]
-TRACKING_DOMAINS_NEED_LATLONG = [
-    str(Platform.SENSOR),
-    "variable",
-]
-HOME_LOCATION_DOMAINS = [CONF_ZONE]
+TRACKING_DOMAINS = frozenset(
+    {
+        str(Platform.DEVICE_TRACKER),
+        str("person"),
+        str(Platform.SENSOR),
+        "variable",
+    }
+)
+TRACKING_DOMAINS_NEED_LATLONG = frozenset(
+    {
+        str(Platform.SENSOR),
+        "variable",
+    }
+)
+HOME_LOCATION_DOMAINS = frozenset({CONF_ZONE})
 
 # Config
 CONF_DEVICETRACKER_ID = "devicetracker_id"
@@ -108,22 +112,24 @@ ATTR_WIKIDATA_ID = "wikidata_id"
 
 
 # Attribute Lists
-CONFIG_ATTRIBUTES_LIST = [
-    CONF_API_KEY,
-    CONF_DEVICETRACKER_ID,
-    CONF_EXTENDED_ATTR,
-    CONF_HOME_ZONE,
-    CONF_ICON,
-    CONF_LANGUAGE,
-    CONF_MAP_PROVIDER,
-    CONF_MAP_ZOOM,
-    CONF_NAME,
-    CONF_DISPLAY_OPTIONS,
-    CONF_SHOW_TIME,
-    CONF_USE_GPS,
-    CONF_UNIQUE_ID,
-]
-RESET_ATTRIBUTE_LIST = [
+CONFIG_ATTRIBUTES_LIST = frozenset(
+    {
+        CONF_API_KEY,
+        CONF_DEVICETRACKER_ID,
+        CONF_EXTENDED_ATTR,
+        CONF_HOME_ZONE,
+        CONF_ICON,
+        CONF_LANGUAGE,
+        CONF_MAP_PROVIDER,
+        CONF_MAP_ZOOM,
+        CONF_NAME,
+        CONF_DISPLAY_OPTIONS,
+        CONF_SHOW_TIME,
+        CONF_USE_GPS,
+        CONF_UNIQUE_ID,
+    }
+)
+RESET_ATTRIBUTE_LIST = (
     ATTR_CITY,
     ATTR_CITY_CLEAN,
     ATTR_COUNTRY,
@@ -152,8 +158,8 @@ RESET_ATTRIBUTE_LIST = [
     # ATTR_UPDATES_SKIPPED,
     ATTR_WIKIDATA_DICT,
     ATTR_WIKIDATA_ID,
-]
-EXTRA_STATE_ATTRIBUTE_LIST = [
+)
+EXTRA_STATE_ATTRIBUTE_LIST = (
     ATTR_PLACE_NAME,
     ATTR_STREET_NUMBER,
     ATTR_STREET,
@@ -195,23 +201,25 @@ EXTRA_STATE_ATTRIBUTE_LIST = [
     ATTR_DISPLAY_OPTIONS,
     ATTR_LAST_CHANGED,
     ATTR_LAST_UPDATED,
-]
-JSON_IGNORE_ATTRIBUTE_LIST = [
-    ATTR_DEVICETRACKER_ID,
-    ATTR_DISPLAY_OPTIONS,
-    ATTR_DISPLAY_OPTIONS_LIST,
-    ATTR_HOME_LATITUDE,
-    ATTR_HOME_LOCATION,
-    ATTR_HOME_LONGITUDE,
-    ATTR_INITIAL_UPDATE,
-    ATTR_DRIVING,
-    ATTR_JSON_FILENAME,
-    ATTR_LOCATION_CURRENT,
-    ATTR_LOCATION_PREVIOUS,
-    ATTR_PREVIOUS_STATE,
-    # ATTR_UPDATES_SKIPPED,
-]
-JSON_ATTRIBUTE_LIST = [
+)
+JSON_IGNORE_ATTRIBUTE_LIST = frozenset(
+    {
+        ATTR_DEVICETRACKER_ID,
+        ATTR_DISPLAY_OPTIONS,
+        ATTR_DISPLAY_OPTIONS_LIST,
+        ATTR_HOME_LATITUDE,
+        ATTR_HOME_LOCATION,
+        ATTR_HOME_LONGITUDE,
+        ATTR_INITIAL_UPDATE,
+        ATTR_DRIVING,
+        ATTR_JSON_FILENAME,
+        ATTR_LOCATION_CURRENT,
+        ATTR_LOCATION_PREVIOUS,
+        ATTR_PREVIOUS_STATE,
+        # ATTR_UPDATES_SKIPPED,
+    }
+)
+JSON_ATTRIBUTE_LIST = (
     ATTR_CITY,
     ATTR_CITY_CLEAN,
     ATTR_COUNTRY,
@@ -255,8 +263,8 @@ JSON_ATTRIBUTE_LIST = [
     ATTR_STREET_REF,
     ATTR_WIKIDATA_DICT,
     ATTR_WIKIDATA_ID,
-]
-EVENT_ATTRIBUTE_LIST = [
+)
+EVENT_ATTRIBUTE_LIST = (
     ATTR_PLACE_NAME,
     ATTR_LAST_CHANGED,
     ATTR_LAST_PLACE_NAME,
@@ -275,14 +283,14 @@ EVENT_ATTRIBUTE_LIST = [
     ATTR_MAP_LINK,
     ATTR_OSM_ID,
     ATTR_OSM_TYPE,
-]
-EXTENDED_ATTRIBUTE_LIST = [
+)
+EXTENDED_ATTRIBUTE_LIST = (
     ATTR_WIKIDATA_ID,
     ATTR_OSM_DICT,
     ATTR_OSM_DETAILS_DICT,
     ATTR_WIKIDATA_DICT,
-]
-PLACE_NAME_DUPLICATE_LIST = [
+)
+PLACE_NAME_DUPLICATE_LIST = (
     ATTR_STREET,
     ATTR_STREET_REF,
     ATTR_PLACE_NEIGHBOURHOOD,
@@ -296,7 +304,7 @@ PLACE_NAME_DUPLICATE_LIST = [
     ATTR_PLACE_CATEGORY,
     ATTR_DEVICETRACKER_ZONE,
     ATTR_DEVICETRACKER_ZONE_NAME,
-]
+)
 
 DISPLAY_OPTIONS_MAP = {
     "driving": ATTR_DRIVING,
@@ -12,16 +12,22 @@ Description:
 GitHub: https://github.com/custom-components/places
 """
 
-import copy
+import asyncio
+import email.utils
 import hashlib
 import json
 import logging
+import math
 import os
 import re
-from datetime import datetime, timedelta
+import time
+import urllib.parse
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
+import aiohttp
 import homeassistant.helpers.config_validation as cv
-import requests
 import voluptuous as vol
 from homeassistant import config_entries, core
 from homeassistant.components.sensor import PLATFORM_SCHEMA, SensorEntity
@@ -40,12 +46,11 @@ from homeassistant.const import (
     CONF_ZONE,
     EVENT_HOMEASSISTANT_START,
 )
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_call_later, async_track_state_change_event
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.util import Throttle, slugify
-from homeassistant.util.location import distance
-from urllib3.exceptions import NewConnectionError
 
 from .const import (  # ATTR_UPDATES_SKIPPED,
     ATTR_CITY,
@@ -142,22 +147,109 @@ try:
     from homeassistant.helpers.issue_registry import IssueSeverity, async_create_issue
 except Exception as e:
     _LOGGER.debug(
-        "Unknown Exception trying to import issue_registry. Is HA version <2022.9?: "
-        + str(e)
+        "Unknown Exception trying to import issue_registry. Is HA version <2022.9?: %s",
+        e,
     )
     use_issue_reg = False
+try:
+    import orjson
+
+    use_orjson = True
+except ImportError:
+    use_orjson = False
 
 THROTTLE_INTERVAL = timedelta(seconds=600)
 SCAN_INTERVAL = timedelta(seconds=30)
+EARTH_RADIUS_M = 6371008.8  # Mean Earth radius
+OSM_CACHE_TTL_SECONDS = 3600
+OSM_CACHE_MAX_ENTRIES = 512
+ADV_OPTIONS_CACHE_MAX_ENTRIES = 64
+NORMALIZED_OPT_CACHE_MAX_ENTRIES = 1024
+# Transient HTTP errors and dropped connections retried by get_dict_from_url,
+# waiting 0.5s then 1s, or longer if the server sends Retry-After
+HTTP_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+HTTP_RETRY_TOTAL = 2
+HTTP_RETRY_BACKOFF_SECONDS = 0.5
+# A longer Retry-After gives up instead of holding the update
+HTTP_RETRY_AFTER_MAX_SECONDS = 30
+# hass.data[DOMAIN] key of the limiter shared by all Places sensors
+OSM_RATE_LIMITER = "_osm_rl"
+# Shared by all Places sensors: cache key -> (time.monotonic() when fetched, dict)
+_OSM_CACHE: OrderedDict[tuple, tuple[float, dict]] = OrderedDict()
+# Keys of the reverse lookup response read by parse_osm_dict
+_OSM_DICT_KEYS = frozenset(
+    {
+        "address",
+        "addresstype",
+        "category",
+        "display_name",
+        "namedetails",
+        "osm_id",
+        "osm_type",
+        "type",
+    }
+)
+# (address key, attribute, transform) copied from the reverse lookup address
+_OSM_ADDRESS_FIELDS = (
+    ("house_number", ATTR_STREET_NUMBER, None),
+    ("road", ATTR_STREET, None),
+    ("state", ATTR_REGION, None),
+    ("ISO3166-2-lvl4", ATTR_STATE_ABBR, lambda v: v.split("-")[1].upper()),
+    ("county", ATTR_COUNTY, None),
+    ("country", ATTR_COUNTRY, None),
+    ("country_code", ATTR_COUNTRY_CODE, str.upper),
+    ("postcode", ATTR_POSTAL_CODE, None),
+)
+# Attributes set from the first of these address keys that is present
+_OSM_ADDRESS_FALLBACKS = (
+    (ATTR_PLACE_NEIGHBOURHOOD, ("neighbourhood", "hamlet", "residential")),
+    (
+        ATTR_CITY,
+        ("city", "town", "village", "township", "municipality", "city_district"),
+    ),
+    (ATTR_POSTAL_TOWN, ("suburb", "city_district")),
+)
+_ZONE_PREFIX = CONF_ZONE + "."
+_OSM_TYPE_ABBR = {"node": "N", "way": "W", "relation": "R"}
+_AWAY_ZONES = frozenset({"away", "not_home", "notset", "not_set"})
+_JSON_IGNORE_SET = CONFIG_ATTRIBUTES_LIST | JSON_IGNORE_ATTRIBUTE_LIST
+_STREET_REF_SPLIT = re.compile(r"[;\\/,.:]")
+_HAS_DIGIT = re.compile(r"\d")
+_MULTISPACE = re.compile(r"\s+")
+_DISPLAY_OPT_SPLIT = re.compile(r"\s*,\s*")
+# Separators in advanced display options
+_ADV_SYMBOL_RE = re.compile(r"[,\[(]")
+_PAREN_SCAN_RE = re.compile(r"[(),]")
+# Any bracket or parenthesis makes the display options advanced
+_ADV_OPTIONS_RE = re.compile(r"[()\[\]]")
+# Display option attributes shown title-cased when all lowercase
+_TITLECASE_ATTRS = frozenset(
+    {ATTR_DEVICETRACKER_ZONE_NAME, ATTR_PLACE_TYPE, ATTR_PLACE_CATEGORY}
+)
+# Advanced display options string -> parsed options, see _parse_advanced_options
+_ADV_OPTIONS_CACHE: dict[str, tuple] = {}
+# Display options that have an attribute
+_KNOWN_OPTS = frozenset(DISPLAY_OPTIONS_MAP)
+# Attributes whose position can be joined to the street number with a space
+_STREET_ATTRS = frozenset({ATTR_STREET, ATTR_STREET_REF})
+# Attributes sent with the state update event when extended_attr is on
+_EXTENDED_EVENT_ATTRIBUTES = EVENT_ATTRIBUTE_LIST + EXTENDED_ATTRIBUTE_LIST
+# Basic display option -> the attribute do_not_reorder shows for it
+_DISPLAY_OPTION_RENAMES = {
+    **DISPLAY_OPTIONS_MAP,
+    "formatted_address": ATTR_FORMATTED_ADDRESS,
+}
+# Display options hidden by do_not_show_not_home
+_ZONE_OPTIONS = frozenset({"zone", "zone_name"})
+# Display option as written -> its DISPLAY_OPTIONS_MAP key
+_NORMALIZED_OPT_CACHE = {option: option for option in DISPLAY_OPTIONS_MAP}
+# Any other map provider gets the Apple link
+_MAP_URL_TEMPLATES = {
+    "google": "https://maps.google.com/?q={loc}&ll={loc}&z={zoom}",
+    "osm": "https://www.openstreetmap.org/?mlat={lat}&mlon={lon}#map={zoom}/{lat8}/{lon9}",
+    "apple": "https://maps.apple.com/maps/?q={loc}&z={zoom}",
+}
 PLACES_JSON_FOLDER = os.path.join("custom_components", DOMAIN, "json_sensors")
-try:
-    os.makedirs(PLACES_JSON_FOLDER, exist_ok=True)
-except OSError as e:
-    _LOGGER.warning("OSError creating folder for JSON sensor files: " + str(e))
-except Exception as e:
-    _LOGGER.warning(
-        "Unknown Exception creating folder for JSON sensor files: " + str(e)
-    )
 
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     {
@@ -195,8 +287,8 @@ async def async_setup_platform(
         _LOGGER.debug("[YAML Import] HA Started, proceeding")
         if validate_import():
             _LOGGER.warning(
-                "[YAML Import] New YAML sensor, importing: "
-                + str(import_config.get(CONF_NAME))
+                "[YAML Import] New YAML sensor, importing: %s",
+                import_config.get(CONF_NAME),
             )
 
             if use_issue_reg and import_config is not None:
@@ -221,119 +313,101 @@ async def async_setup_platform(
 
     @core.callback
     def validate_import():
+        devicetracker_id = import_config.get(CONF_DEVICETRACKER_ID)
         if CONF_DEVICETRACKER_ID not in import_config:
             # device_tracker not defined in config
             ERROR = "[YAML Validate] Not importing: devicetracker_id not defined in the YAML places sensor definition"
             _LOGGER.error(ERROR)
             return False
-        elif import_config.get(CONF_DEVICETRACKER_ID) is None:
+        elif devicetracker_id is None:
             # device_tracker not defined in config
             ERROR = "[YAML Validate] Not importing: devicetracker_id not defined in the YAML places sensor definition"
             _LOGGER.error(ERROR)
             return False
-        _LOGGER.debug(
-            "[YAML Validate] devicetracker_id: "
-            + str(import_config.get(CONF_DEVICETRACKER_ID))
-        )
-        if (
-            import_config.get(CONF_DEVICETRACKER_ID).split(".")[0]
-            not in TRACKING_DOMAINS
-        ):
+        _LOGGER.debug("[YAML Validate] devicetracker_id: %s", devicetracker_id)
+        devicetracker_domain = devicetracker_id.split(".")[0]
+        if devicetracker_domain not in TRACKING_DOMAINS:
             # entity isn't in supported type
             ERROR = (
                 "[YAML Validate] Not importing: devicetracker_id: "
-                + str(import_config.get(CONF_DEVICETRACKER_ID))
+                + str(devicetracker_id)
                 + " is not one of the supported types: "
-                + str(list(TRACKING_DOMAINS))
+                + str(sorted(TRACKING_DOMAINS))
             )
             _LOGGER.error(ERROR)
             return False
-        elif not hass.states.get(import_config.get(CONF_DEVICETRACKER_ID)):
+        devicetracker_state = hass.states.get(devicetracker_id)
+        if not devicetracker_state:
             # entity doesn't exist
             ERROR = (
                 "[YAML Validate] Not importing: devicetracker_id: "
-                + str(import_config.get(CONF_DEVICETRACKER_ID))
+                + str(devicetracker_id)
                 + " doesn't exist"
             )
             _LOGGER.error(ERROR)
             return False
 
-        if import_config.get(CONF_DEVICETRACKER_ID).split(".")[
-            0
-        ] in TRACKING_DOMAINS_NEED_LATLONG and not (
-            CONF_LATITUDE
-            in hass.states.get(import_config.get(CONF_DEVICETRACKER_ID)).attributes
-            and CONF_LONGITUDE
-            in hass.states.get(import_config.get(CONF_DEVICETRACKER_ID)).attributes
+        devicetracker_attributes = devicetracker_state.attributes
+        if devicetracker_domain in TRACKING_DOMAINS_NEED_LATLONG and not (
+            CONF_LATITUDE in devicetracker_attributes
+            and CONF_LONGITUDE in devicetracker_attributes
         ):
             _LOGGER.debug(
-                "[YAML Validate] devicetracker_id: "
-                + str(import_config.get(CONF_DEVICETRACKER_ID))
-                + ": Lat/Long: "
-                + str(
-                    hass.states.get(
-                        import_config.get(CONF_DEVICETRACKER_ID)
-                    ).attributes.get(CONF_LATITUDE)
-                )
-                + " / "
-                + str(
-                    hass.states.get(
-                        import_config.get(CONF_DEVICETRACKER_ID)
-                    ).attributes.get(CONF_LONGITUDE)
-                )
+                "[YAML Validate] devicetracker_id: %s: Lat/Long: %s / %s",
+                devicetracker_id,
+                devicetracker_attributes.get(CONF_LATITUDE),
+                devicetracker_attributes.get(CONF_LONGITUDE),
             )
             ERROR = (
                 "[YAML Validate] Not importing: devicetracker_id: "
-                + import_config.get(CONF_DEVICETRACKER_ID)
+                + devicetracker_id
                 + " doesnt have latitude/longitude as attributes"
             )
             _LOGGER.error(ERROR)
             return False
 
         if CONF_HOME_ZONE in import_config:
-            if import_config.get(CONF_HOME_ZONE) is None:
+            home_zone = import_config.get(CONF_HOME_ZONE)
+            if home_zone is None:
                 # home zone not defined in config
                 ERROR = "[YAML Validate] Not importing: home_zone is blank in the YAML places sensor definition"
                 _LOGGER.error(ERROR)
                 return False
-            _LOGGER.debug(
-                "[YAML Validate] home_zone: " + str(import_config.get(CONF_HOME_ZONE))
-            )
+            _LOGGER.debug("[YAML Validate] home_zone: %s", home_zone)
 
-            if (
-                import_config.get(CONF_HOME_ZONE).split(".")[0]
-                not in HOME_LOCATION_DOMAINS
-            ):
+            if home_zone.split(".")[0] not in HOME_LOCATION_DOMAINS:
                 # entity isn't in supported type
                 ERROR = (
                     "[YAML Validate] Not importing: home_zone: "
-                    + str(import_config.get(CONF_HOME_ZONE))
+                    + str(home_zone)
                     + " is not one of the supported types: "
-                    + str(list(HOME_LOCATION_DOMAINS))
+                    + str(sorted(HOME_LOCATION_DOMAINS))
                 )
                 _LOGGER.error(ERROR)
                 return False
-            elif not hass.states.get(import_config.get(CONF_HOME_ZONE)):
+            elif not hass.states.get(home_zone):
                 # entity doesn't exist
                 ERROR = (
                     "[YAML Validate] Not importing: home_zone: "
-                    + str(import_config.get(CONF_HOME_ZONE))
+                    + str(home_zone)
                     + " doesn't exist"
                 )
                 _LOGGER.error(ERROR)
                 return False
 
-        # Generate pseudo-unique id using MD5 and store in config to try to prevent reimporting already imported yaml sensors.
+        # Generate pseudo-unique id using BLAKE2 and store in config to try to prevent reimporting already imported yaml sensors.
         string_to_hash = (
             import_config.get(CONF_NAME)
-            + import_config.get(CONF_DEVICETRACKER_ID)
+            + devicetracker_id
             + import_config.get(CONF_HOME_ZONE)
         )
         # _LOGGER.debug(
         #    "[YAML Validate] string_to_hash: " + str(string_to_hash)
         # )
-        yaml_hash_object = hashlib.md5(string_to_hash.encode())
-        yaml_hash = yaml_hash_object.hexdigest()
+        encoded_string_to_hash = string_to_hash.encode("utf-8")
+        yaml_hash = hashlib.blake2b(encoded_string_to_hash, digest_size=8).hexdigest()
+        # Sensors imported by earlier versions were fingerprinted with MD5
+        legacy_yaml_hash = hashlib.md5(encoded_string_to_hash).hexdigest()
 
         import_config.setdefault(CONF_YAML_HASH, yaml_hash)
         # _LOGGER.debug("[YAML Validate] final import_config: " + str(import_config))
@@ -345,7 +419,7 @@ async def async_setup_platform(
             and hass.data.get(DOMAIN).values() is not None
         ):
             for m in list(hass.data.get(DOMAIN).values()):
-                if CONF_YAML_HASH in m:
+                if isinstance(m, dict) and CONF_YAML_HASH in m:
                     all_yaml_hashes.append(m.get(CONF_YAML_HASH))
 
         # _LOGGER.debug(
@@ -354,17 +428,20 @@ async def async_setup_platform(
         # _LOGGER.debug(
         #    "[YAML Validate] All existing YAML hashes: " + str(all_yaml_hashes)
         # )
-        if import_config.get(CONF_YAML_HASH) not in all_yaml_hashes:
+        if (
+            import_config.get(CONF_YAML_HASH) not in all_yaml_hashes
+            and legacy_yaml_hash not in all_yaml_hashes
+        ):
             return True
         else:
             _LOGGER.info(
-                "[YAML Validate] YAML sensor already imported, ignoring: "
-                + str(import_config.get(CONF_NAME))
+                "[YAML Validate] YAML sensor already imported, ignoring: %s",
+                import_config.get(CONF_NAME),
             )
             return False
 
     import_config = dict(config)
-    _LOGGER.debug("[YAML Import] initial import_config: " + str(import_config))
+    _LOGGER.debug("[YAML Import] initial import_config: %s", import_config)
     import_config.pop(CONF_PLATFORM, None)
     import_config.pop(CONF_SCAN_INTERVAL, None)
 
@@ -388,24 +465,176 @@ async def async_setup_entry(
     # _LOGGER.debug("[async_setup_entry] unique_id: " + str(unique_id))
     # _LOGGER.debug("[async_setup_entry] config: " + str(config))
 
-    async_add_entities(
-        [Places(hass, config, config_entry, name, unique_id)], update_before_add=True
+    await hass.async_add_executor_job(_create_json_folder)
+    # Nominatim's usage policy allows at most 1 request per second in total
+    hass.data[DOMAIN].setdefault(OSM_RATE_LIMITER, _TokenBucket(rate=1.0))
+    sensor = Places(hass, config, config_entry, name, unique_id)
+    # Restore the saved attributes before the initial update runs
+    await sensor.async_import_attributes_from_json_file()
+    async_add_entities([sensor], update_before_add=True)
+
+
+class _TokenBucket:
+    """Limit how often a shared endpoint is called."""
+
+    def __init__(self, rate=1.0, capacity=1):
+        self._interval = 1 / rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a request is allowed."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._updated) / self._interval,
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * self._interval)
+
+
+def _create_json_folder():
+    try:
+        os.makedirs(PLACES_JSON_FOLDER, exist_ok=True)
+    except OSError as e:
+        _LOGGER.warning("OSError creating folder for JSON sensor files: %s", e)
+    except Exception as e:
+        _LOGGER.warning(
+            "Unknown Exception creating folder for JSON sensor files: %s", e
+        )
+
+
+def _retry_after_seconds(value):
+    """Return the seconds to wait from a Retry-After header, or None."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _haversine_m(lat1, lon1, lat2, lon2):
+    """Return the great-circle distance in meters between two points."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    a = (
+        math.sin((phi2 - phi1) / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+@lru_cache(maxsize=256)
+def _distance_m(lat1, lon1, lat2, lon2):
+    """Return the distance in meters between two points.
+
+    Points within a degree of each other use the flat-earth approximation,
+    which is well within GPS accuracy there and needs a single cos(). A
+    tracker that reports the same position again hits the cache.
+    """
+    d_lat = lat2 - lat1
+    d_lon = lon2 - lon1
+    if abs(d_lat) > 1 or abs(d_lon) > 1:
+        return _haversine_m(lat1, lon1, lat2, lon2)
+    return EARTH_RADIUS_M * math.hypot(
+        math.radians(d_lat),
+        math.radians(d_lon) * math.cos(math.radians(lat1 + lat2) / 2),
     )
 
 
+def _json_loads(data):
+    """Decode JSON from bytes, using orjson when it is available."""
+    if use_orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj):
+    """Encode an object to JSON bytes, using orjson when it is available."""
+    if use_orjson:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+@lru_cache(maxsize=32)
+def _parse_display_options(display_options):
+    """Split a display options string into a tuple of stripped options."""
+    return tuple(_DISPLAY_OPT_SPLIT.split(display_options.strip()))
+
+
 class Places(SensorEntity):
     """Representation of a Places Sensor."""
 
+    # Only the sensor's own state. SensorEntity keeps its __dict__ for the
+    # entity attributes Home Assistant sets, including the _attr_ ones
+    __slots__ = (
+        "_attrs_dirty",
+        "_cached_extra_attributes",
+        "_config",
+        "_config_entry",
+        "_current_location",
+        "_duplicate_values",
+        "_hass",
+        "_home_latitude",
+        "_home_location",
+        "_home_longitude",
+        "_home_zone_name",
+        "_ia_get",
+        "_ia_pop",
+        "_ia_set",
+        "_in_zone_cache",
+        "_internal_attr",
+        "_language_keys",
+        "_last_changed",
+        "_saved_attributes",
+        "_session",
+        "_update_lock",
+        "adv_options_state_list",
+        "street_i",
+        "street_num_i",
+        "temp_i",
+    )
+
     def __init__(self, hass, config, config_entry, name, unique_id):
         """Initialize the sensor."""
         self._attr_should_poll = True
-        _LOGGER.info("(" + str(name) + ") [Init] Places sensor: " + str(name))
+        _LOGGER.info("(%s) [Init] Places sensor: %s", name, name)
 
         self._internal_attr = {}
+        # Bound once for the accessors. _internal_attr must only be changed in
+        # place from here on so these stay pointed at the live dict.
+        self._ia_get = self._internal_attr.get
+        self._ia_set = self._internal_attr.__setitem__
+        self._ia_pop = self._internal_attr.pop
+        # extra_state_attributes is rebuilt only after the attributes change
+        self._cached_extra_attributes = None
+        self._attrs_dirty = True
+        # Result of in_zone(), reset whenever the tracker zone may have changed
+        self._in_zone_cache = None
+        # Values of PLACE_NAME_DUPLICATE_LIST, collected in parse_osm_dict
+        self._duplicate_values = set()
+        # Attributes last written by async_write_sensor_to_json
+        self._saved_attributes = None
         self.set_attr(ATTR_INITIAL_UPDATE, True)
         self._config = config
         self._config_entry = config_entry
         self._hass = hass
+        self._session = async_get_clientsession(hass)
         self.set_attr(CONF_NAME, name)
         self._attr_name = name
         self.set_attr(CONF_UNIQUE_ID, unique_id)
@@ -436,6 +665,12 @@ class Places(SensorEntity):
             self.set_attr(
                 CONF_LANGUAGE, self.get_attr(CONF_LANGUAGE).replace(" ", "").strip()
             )
+        # namedetails keys checked by parse_osm_dict, in language preference order
+        self._language_keys = tuple(
+            "name:" + language
+            for language in (self.get_attr(CONF_LANGUAGE) or "").split(",")
+            if language
+        )
         self.set_attr(
             CONF_EXTENDED_ATTR,
             config.setdefault(CONF_EXTENDED_ATTR, DEFAULT_EXTENDED_ATTR),
@@ -450,71 +685,91 @@ class Places(SensorEntity):
         )
         self.set_attr(ATTR_DISPLAY_OPTIONS, self.get_attr(CONF_DISPLAY_OPTIONS))
         _LOGGER.debug(
-            "("
-            + self.get_attr(CONF_NAME)
-            + ") [Init] JSON Filename: "
-            + str(self.get_attr(ATTR_JSON_FILENAME))
+            "(%s) [Init] JSON Filename: %s", name, self.get_attr(ATTR_JSON_FILENAME)
         )
 
         self._attr_native_value = None  # Represents the state in SensorEntity
         self.clear_attr(ATTR_NATIVE_VALUE)
 
-        if (
-            not self.is_attr_blank(CONF_HOME_ZONE)
-            and CONF_LATITUDE
-            in hass.states.get(self.get_attr(CONF_HOME_ZONE)).attributes
-            and hass.states.get(self.get_attr(CONF_HOME_ZONE)).attributes.get(
-                CONF_LATITUDE
-            )
-            is not None
-            and self.is_float(
-                hass.states.get(self.get_attr(CONF_HOME_ZONE)).attributes.get(
-                    CONF_LATITUDE
-                )
-            )
-        ):
-            self.set_attr(
-                ATTR_HOME_LATITUDE,
-                str(
-                    hass.states.get(self.get_attr(CONF_HOME_ZONE)).attributes.get(
-                        CONF_LATITUDE
-                    )
-                ),
-            )
-        if (
-            not self.is_attr_blank(CONF_HOME_ZONE)
-            and CONF_LONGITUDE
-            in hass.states.get(self.get_attr(CONF_HOME_ZONE)).attributes
-            and hass.states.get(self.get_attr(CONF_HOME_ZONE)).attributes.get(
-                CONF_LONGITUDE
-            )
-            is not None
-            and self.is_float(
-                hass.states.get(self.get_attr(CONF_HOME_ZONE)).attributes.get(
-                    CONF_LONGITUDE
+        # Parsed once here so the distance from home doesn't re-parse the strings
+        self._home_latitude = None
+        self._home_longitude = None
+        # Zone name without the "zone." prefix, for logging
+        self._home_zone_name = None
+        # home_location, set once both home coordinates are known
+        self._home_location = None
+        # (latitude, longitude) and the current_location string built from them
+        self._current_location = (None, None)
+        # last_changed string and the datetime parsed from it
+        self._last_changed = (None, None)
+        # Held for the whole of do_update
+        self._update_lock = asyncio.Lock()
+        if not self.is_attr_blank(CONF_HOME_ZONE):
+            self._home_zone_name = self.get_attr(CONF_HOME_ZONE).partition(".")[2]
+            home_zone_attributes = getattr(
+                hass.states.get(self.get_attr(CONF_HOME_ZONE)), "attributes", {}
+            )
+            home_latitude = home_zone_attributes.get(CONF_LATITUDE)
+            if self.is_float(home_latitude):
+                self._home_latitude = float(home_latitude)
+                self.set_attr(ATTR_HOME_LATITUDE, self._home_latitude)
+            home_longitude = home_zone_attributes.get(CONF_LONGITUDE)
+            if self.is_float(home_longitude):
+                self._home_longitude = float(home_longitude)
+                self.set_attr(ATTR_HOME_LONGITUDE, self._home_longitude)
+            if self._home_latitude is not None and self._home_longitude is not None:
+                self._home_location = (
+                    str(self._home_latitude) + "," + str(self._home_longitude)
                 )
-            )
-        ):
-            self.set_attr(
-                ATTR_HOME_LONGITUDE,
-                str(
-                    hass.states.get(self.get_attr(CONF_HOME_ZONE)).attributes.get(
-                        CONF_LONGITUDE
-                    )
-                ),
-            )
 
+        devicetracker_state = hass.states.get(self.get_attr(CONF_DEVICETRACKER_ID))
         self._attr_entity_picture = (
-            hass.states.get(self.get_attr(CONF_DEVICETRACKER_ID)).attributes.get(
-                ATTR_PICTURE
-            )
-            if hass.states.get(self.get_attr(CONF_DEVICETRACKER_ID))
+            devicetracker_state.attributes.get(ATTR_PICTURE)
+            if devicetracker_state
             else None
         )
 
         # self.set_attr(ATTR_UPDATES_SKIPPED, 0)
 
-        sensor_attributes = self.get_dict_from_json_file()
+        self.cleanup_attributes()
+        _LOGGER.info(
+            "(%s) [Init] DeviceTracker Entity ID: %s",
+            name,
+            self.get_attr(CONF_DEVICETRACKER_ID),
+        )
+
+    def get_dict_from_json_file(self):
+        sensor_attributes = {}
+        try:
+            with open(
+                os.path.join(PLACES_JSON_FOLDER, self.get_attr(ATTR_JSON_FILENAME)),
+                "rb",
+            ) as jsonfile:
+                sensor_attributes = _json_loads(jsonfile.read())
+        except OSError as e:
+            _LOGGER.debug(
+                "(%s) [Init] No JSON file to import (%s): %s",
+                self.get_attr(CONF_NAME),
+                self.get_attr(ATTR_JSON_FILENAME),
+                e,
+            )
+            return {}
+        except Exception as e:
+            _LOGGER.debug(
+                "(%s) [Init] Unknown Exception importing JSON file (%s): %s",
+                self.get_attr(CONF_NAME),
+                self.get_attr(ATTR_JSON_FILENAME),
+                e,
+            )
+            return {}
+        return sensor_attributes
+
+    async def async_import_attributes_from_json_file(self):
+        """Import the attributes saved in the JSON file off the event loop."""
+        name = self.get_attr(CONF_NAME)
+        sensor_attributes = await self._hass.async_add_executor_job(
+            self.get_dict_from_json_file
+        )
         # _LOGGER.debug(
         #    "("
         #    + self.get_attr(CONF_NAME)
@@ -536,48 +791,8 @@ class Places(SensorEntity):
         # )
         ##
         if not self.get_attr(ATTR_INITIAL_UPDATE):
-            _LOGGER.debug(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") [Init] Sensor Attributes Imported from JSON file"
-            )
+            _LOGGER.debug("(%s) [Init] Sensor Attributes Imported from JSON file", name)
         self.cleanup_attributes()
-        _LOGGER.info(
-            "("
-            + self.get_attr(CONF_NAME)
-            + ") [Init] DeviceTracker Entity ID: "
-            + self.get_attr(CONF_DEVICETRACKER_ID)
-        )
-
-    def get_dict_from_json_file(self):
-        sensor_attributes = {}
-        try:
-            with open(
-                os.path.join(PLACES_JSON_FOLDER, self.get_attr(ATTR_JSON_FILENAME)),
-                "r",
-            ) as jsonfile:
-                sensor_attributes = json.load(jsonfile)
-        except OSError as e:
-            _LOGGER.debug(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") [Init] No JSON file to import ("
-                + str(self.get_attr(ATTR_JSON_FILENAME))
-                + "): "
-                + str(e)
-            )
-            return {}
-        except Exception as e:
-            _LOGGER.debug(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") [Init] Unknown Exception importing JSON file ("
-                + str(self.get_attr(ATTR_JSON_FILENAME))
-                + "): "
-                + str(e)
-            )
-            return {}
-        return sensor_attributes
 
     async def async_added_to_hass(self) -> None:
         """Added to hass."""
@@ -589,57 +804,61 @@ class Places(SensorEntity):
             )
         )
         _LOGGER.debug(
-            "("
-            + self.get_attr(CONF_NAME)
-            + ") [Init] Subscribed to DeviceTracker state change events"
+            "(%s) [Init] Subscribed to DeviceTracker state change events",
+            self.get_attr(CONF_NAME),
         )
 
     async def async_will_remove_from_hass(self) -> None:
         """Run when entity will be removed from hass."""
         try:
-            os.remove(
-                os.path.join(PLACES_JSON_FOLDER, self.get_attr(ATTR_JSON_FILENAME))
+            await self._hass.async_add_executor_job(
+                os.remove,
+                os.path.join(PLACES_JSON_FOLDER, self.get_attr(ATTR_JSON_FILENAME)),
             )
         except OSError as e:
             _LOGGER.debug(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") OSError removing JSON sensor file ("
-                + str(self.get_attr(ATTR_JSON_FILENAME))
-                + "): "
-                + str(e)
+                "(%s) OSError removing JSON sensor file (%s): %s",
+                self.get_attr(CONF_NAME),
+                self.get_attr(ATTR_JSON_FILENAME),
+                e,
             )
         except Exception as e:
             _LOGGER.debug(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") Unknown Exception removing JSON sensor file ("
-                + str(self.get_attr(ATTR_JSON_FILENAME))
-                + "): "
-                + str(e)
+                "(%s) Unknown Exception removing JSON sensor file (%s): %s",
+                self.get_attr(CONF_NAME),
+                self.get_attr(ATTR_JSON_FILENAME),
+                e,
             )
         else:
             _LOGGER.debug(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") JSON sensor file removed: "
-                + str(self.get_attr(ATTR_JSON_FILENAME))
+                "(%s) JSON sensor file removed: %s",
+                self.get_attr(CONF_NAME),
+                self.get_attr(ATTR_JSON_FILENAME),
             )
 
     @property
     def extra_state_attributes(self):
         """Return the state attributes."""
-        return_attr = {}
-        self.cleanup_attributes()
-        for attr in EXTRA_STATE_ATTRIBUTE_LIST:
-            if self.get_attr(attr):
-                return_attr.update({attr: self.get_attr(attr)})
-
-        if self.get_attr(CONF_EXTENDED_ATTR):
-            for attr in EXTENDED_ATTRIBUTE_LIST:
-                if self.get_attr(attr):
-                    return_attr.update({attr: self.get_attr(attr)})
+        if not self._attrs_dirty and self._cached_extra_attributes is not None:
+            return self._cached_extra_attributes
+        internal_attr = self._internal_attr
+        return_attr = {
+            attr: internal_attr[attr]
+            for attr in EXTRA_STATE_ATTRIBUTE_LIST
+            if internal_attr.get(attr)
+        }
+
+        if internal_attr.get(CONF_EXTENDED_ATTR):
+            return_attr.update(
+                {
+                    attr: internal_attr[attr]
+                    for attr in EXTENDED_ATTRIBUTE_LIST
+                    if internal_attr.get(attr)
+                }
+            )
         # _LOGGER.debug("(" + self.get_attr(CONF_NAME) + ") Extra State Attributes: " + str(return_attr))
+        self._cached_extra_attributes = return_attr
+        self._attrs_dirty = False
         return return_attr
 
     def import_attributes_from_json(self, json_attr=None):
@@ -648,67 +867,52 @@ class Places(SensorEntity):
             return
 
         self.set_attr(ATTR_INITIAL_UPDATE, False)
+        json_keys = set(json_attr)
         for attr in JSON_ATTRIBUTE_LIST:
-            if attr in json_attr:
-                self.set_attr(attr, json_attr.pop(attr, None))
+            if attr in json_keys:
+                self.set_attr(attr, json_attr.pop(attr))
+                json_keys.discard(attr)
         if not self.is_attr_blank(ATTR_NATIVE_VALUE):
             self._attr_native_value = self.get_attr(ATTR_NATIVE_VALUE)
 
         # Remove attributes that are part of the Config and are explicitly not imported from JSON
-        for attr in CONFIG_ATTRIBUTES_LIST + JSON_IGNORE_ATTRIBUTE_LIST:
-            if attr in json_attr:
-                json_attr.pop(attr, None)
+        for attr in _JSON_IGNORE_SET.intersection(json_keys):
+            json_attr.pop(attr, None)
         if json_attr is not None and json_attr:
             _LOGGER.debug(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") [import_attributes] Attributes not imported: "
-                + str(json_attr)
+                "(%s) [import_attributes] Attributes not imported: %s",
+                self.get_attr(CONF_NAME),
+                json_attr,
             )
 
     def get_attr(self, attr, default=None):
-        if attr is None or (default is None and self.is_attr_blank(attr)):
+        if attr is None:
             return None
-        else:
-            return self._internal_attr.get(attr, default)
+        value = self._ia_get(attr, default)
+        if default is None and not (value or value == 0):
+            return None
+        return value
 
     def set_attr(self, attr, value=None):
         if attr is not None:
-            self._internal_attr.update({attr: value})
+            self._ia_set(attr, value)
+            self._attrs_dirty = True
 
     def clear_attr(self, attr):
-        self._internal_attr.pop(attr, None)
+        self._ia_pop(attr, None)
+        self._attrs_dirty = True
 
     def is_devicetracker_set(self):
-
-        if (
-            not self.is_attr_blank(CONF_DEVICETRACKER_ID)
-            and hasattr(
-                self._hass.states.get(self.get_attr(CONF_DEVICETRACKER_ID)),
-                "attributes",
-            )
-            and CONF_LATITUDE
-            in self._hass.states.get(self.get_attr(CONF_DEVICETRACKER_ID)).attributes
-            and CONF_LONGITUDE
-            in self._hass.states.get(self.get_attr(CONF_DEVICETRACKER_ID)).attributes
-            and self._hass.states.get(
-                self.get_attr(CONF_DEVICETRACKER_ID)
-            ).attributes.get(CONF_LATITUDE)
-            is not None
-            and self._hass.states.get(
-                self.get_attr(CONF_DEVICETRACKER_ID)
-            ).attributes.get(CONF_LONGITUDE)
-            is not None
-            and self.is_float(
-                self._hass.states.get(
-                    self.get_attr(CONF_DEVICETRACKER_ID)
-                ).attributes.get(CONF_LATITUDE)
-            )
-            and self.is_float(
-                self._hass.states.get(
-                    self.get_attr(CONF_DEVICETRACKER_ID)
-                ).attributes.get(CONF_LONGITUDE)
-            )
+        if self.is_attr_blank(CONF_DEVICETRACKER_ID):
+            return False
+        devicetracker_attributes = getattr(
+            self._hass.states.get(self.get_attr(CONF_DEVICETRACKER_ID)),
+            "attributes",
+            None,
+        )
+        if devicetracker_attributes and (
+            self.is_float(devicetracker_attributes.get(CONF_LATITUDE))
+            and self.is_float(devicetracker_attributes.get(CONF_LONGITUDE))
         ):
             # _LOGGER.debug(
             #    "(" + self.get_attr(CONF_NAME) +
@@ -722,6 +926,7 @@ class Places(SensorEntity):
             # )
             return False
 
+    @core.callback
     def tsc_update(self, tscarg=None):
         """Call the do_update function based on the TSC (track state change) event"""
         if self.is_devicetracker_set():
@@ -730,7 +935,7 @@ class Places(SensorEntity):
             #    + self.get_attr(CONF_NAME)
             #    + ") [TSC Update] Running Update - Devicetracker is set"
             # )
-            self.do_update("Track State Change")
+            self._hass.async_create_task(self.do_update("Track State Change"))
         # else:
         # _LOGGER.debug(
         #    "("
@@ -747,7 +952,7 @@ class Places(SensorEntity):
             #    + self.get_attr(CONF_NAME)
             #    + ") [Async Update] Running Update - Devicetracker is set"
             # )
-            await self._hass.async_add_executor_job(self.do_update, "Scan Interval")
+            await self.do_update("Scan Interval")
         # else:
         # _LOGGER.debug(
         #    "("
@@ -756,6 +961,9 @@ class Places(SensorEntity):
         # )
 
     def is_float(self, value):
+        # Tracker coordinates are usually numbers already
+        if isinstance(value, (float, int)):
+            return True
         if value is not None:
             try:
                 float(value)
@@ -766,25 +974,18 @@ class Places(SensorEntity):
             return False
 
     def in_zone(self):
-        if not self.is_attr_blank(ATTR_DEVICETRACKER_ZONE):
-            if (
-                "stationary" in self.get_attr(ATTR_DEVICETRACKER_ZONE).lower()
-                or self.get_attr(ATTR_DEVICETRACKER_ZONE).lower() == "away"
-                or self.get_attr(ATTR_DEVICETRACKER_ZONE).lower() == "not_home"
-                or self.get_attr(ATTR_DEVICETRACKER_ZONE).lower() == "notset"
-                or self.get_attr(ATTR_DEVICETRACKER_ZONE).lower() == "not_set"
-            ):
-                return False
+        if self._in_zone_cache is None:
+            zone = self.get_attr(ATTR_DEVICETRACKER_ZONE)
+            if zone is None:
+                self._in_zone_cache = False
             else:
-                return True
-        else:
-            return False
+                zone = zone.lower()
+                self._in_zone_cache = not ("stationary" in zone or zone in _AWAY_ZONES)
+        return self._in_zone_cache
 
     def is_attr_blank(self, attr):
-        if self._internal_attr.get(attr) or self._internal_attr.get(attr) == 0:
-            return False
-        else:
-            return True
+        value = self._ia_get(attr)
+        return not (value or value == 0)
 
     def cleanup_attributes(self):
         for attr in list(self._internal_attr):
@@ -794,40 +995,24 @@ class Places(SensorEntity):
     def check_for_updated_entity_name(self):
         if hasattr(self, "entity_id") and self.entity_id is not None:
             # _LOGGER.debug("(" + self.get_attr(CONF_NAME) + ") Entity ID: " + str(self.entity_id))
-            if (
-                self._hass.states.get(str(self.entity_id)) is not None
-                and self._hass.states.get(str(self.entity_id)).attributes.get(
-                    ATTR_FRIENDLY_NAME
-                )
-                is not None
-                and self.get_attr(CONF_NAME)
-                != self._hass.states.get(str(self.entity_id)).attributes.get(
-                    ATTR_FRIENDLY_NAME
-                )
-            ):
+            entity_state = self._hass.states.get(str(self.entity_id))
+            new_name = (
+                entity_state.attributes.get(ATTR_FRIENDLY_NAME)
+                if entity_state is not None
+                else None
+            )
+            name = self.get_attr(CONF_NAME)
+            if new_name is not None and name != new_name:
                 _LOGGER.debug(
-                    "("
-                    + self.get_attr(CONF_NAME)
-                    + ") Sensor Name Changed. Updating Name to: "
-                    + str(
-                        self._hass.states.get(str(self.entity_id)).attributes.get(
-                            ATTR_FRIENDLY_NAME
-                        )
-                    )
-                )
-                self.set_attr(
-                    CONF_NAME,
-                    self._hass.states.get(str(self.entity_id)).attributes.get(
-                        ATTR_FRIENDLY_NAME
-                    ),
+                    "(%s) Sensor Name Changed. Updating Name to: %s", name, new_name
                 )
-                self._config.update({CONF_NAME: self.get_attr(CONF_NAME)})
-                self.set_attr(CONF_NAME, self.get_attr(CONF_NAME))
+                name = new_name
+                self.set_attr(CONF_NAME, name)
+                self._config.update({CONF_NAME: name})
                 _LOGGER.debug(
-                    "("
-                    + self.get_attr(CONF_NAME)
-                    + ") Updated Config Name: "
-                    + str(self._config.get(CONF_NAME, None))
+                    "(%s) Updated Config Name: %s",
+                    name,
+                    self._config.get(CONF_NAME, None),
                 )
                 self._hass.config_entries.async_update_entry(
                     self._config_entry,
@@ -835,38 +1020,35 @@ class Places(SensorEntity):
                     options=self._config_entry.options,
                 )
                 _LOGGER.debug(
-                    "("
-                    + self.get_attr(CONF_NAME)
-                    + ") Updated ConfigEntry Name: "
-                    + str(self._config_entry.data.get(CONF_NAME))
+                    "(%s) Updated ConfigEntry Name: %s",
+                    name,
+                    self._config_entry.data.get(CONF_NAME),
                 )
 
     def get_zone_details(self):
-        self.set_attr(
-            ATTR_DEVICETRACKER_ZONE,
-            self._hass.states.get(self.get_attr(CONF_DEVICETRACKER_ID)).state,
+        name = self.get_attr(CONF_NAME)
+        devicetracker_state = self._hass.states.get(
+            self.get_attr(CONF_DEVICETRACKER_ID)
         )
+        self.set_attr(ATTR_DEVICETRACKER_ZONE, devicetracker_state.state)
+        self._in_zone_cache = None
         if self.in_zone():
             devicetracker_zone_name_state = None
-            devicetracker_zone_id = self._hass.states.get(
-                self.get_attr(CONF_DEVICETRACKER_ID)
-            ).attributes.get(CONF_ZONE)
+            devicetracker_zone_id = devicetracker_state.attributes.get(CONF_ZONE)
             if devicetracker_zone_id is not None:
-                devicetracker_zone_id = (
-                    str(CONF_ZONE) + "." + str(devicetracker_zone_id)
-                )
+                devicetracker_zone_id = _ZONE_PREFIX + str(devicetracker_zone_id)
                 devicetracker_zone_name_state = self._hass.states.get(
                     devicetracker_zone_id
                 )
             # _LOGGER.debug(
             #    "("
-            #    + self.get_attr(CONF_NAME)
+            #    + name
             #    + ") DeviceTracker Zone ID: "
             #    + str(devicetracker_zone_id)
             # )
             # _LOGGER.debug(
             #    "("
-            #    + self.get_attr(CONF_NAME)
+            #    + name
             #    + ") DeviceTracker Zone Name State: "
             #    + str(devicetracker_zone_name_state)
             # )
@@ -890,49 +1072,41 @@ class Places(SensorEntity):
                     ATTR_DEVICETRACKER_ZONE_NAME, self.get_attr(ATTR_DEVICETRACKER_ZONE)
                 )
 
-            if not self.is_attr_blank(ATTR_DEVICETRACKER_ZONE_NAME) and self.get_attr(
-                ATTR_DEVICETRACKER_ZONE_NAME
-            ).lower() == self.get_attr(ATTR_DEVICETRACKER_ZONE_NAME):
-                self.set_attr(
-                    ATTR_DEVICETRACKER_ZONE_NAME,
-                    self.get_attr(ATTR_DEVICETRACKER_ZONE_NAME).title(),
-                )
+            name_val = self.get_attr(ATTR_DEVICETRACKER_ZONE_NAME)
+            # A name with no cased characters is left alone by title() anyway
+            if name_val and name_val.islower():
+                self.set_attr(ATTR_DEVICETRACKER_ZONE_NAME, name_val.title())
             _LOGGER.debug(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") DeviceTracker Zone Name: "
-                + str(self.get_attr(ATTR_DEVICETRACKER_ZONE_NAME))
+                "(%s) DeviceTracker Zone Name: %s",
+                name,
+                self.get_attr(ATTR_DEVICETRACKER_ZONE_NAME),
             )
         else:
             _LOGGER.debug(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") DeviceTracker Zone: "
-                + str(self.get_attr(ATTR_DEVICETRACKER_ZONE))
+                "(%s) DeviceTracker Zone: %s",
+                name,
+                self.get_attr(ATTR_DEVICETRACKER_ZONE),
             )
             self.set_attr(
                 ATTR_DEVICETRACKER_ZONE_NAME, self.get_attr(ATTR_DEVICETRACKER_ZONE)
             )
 
     def determine_if_update_needed(self):
+        name = self.get_attr(CONF_NAME)
+        distance_traveled = self.get_attr(ATTR_DISTANCE_TRAVELED_M) or 0.0
         proceed_with_update = 1
         # 0: False. 1: True. 2: False, but set direction of travel to stationary
 
         if self.get_attr(ATTR_INITIAL_UPDATE):
-            _LOGGER.info(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") Performing Initial Update for user..."
-            )
+            _LOGGER.info("(%s) Performing Initial Update for user...", name)
             proceed_with_update = 1
             # 0: False. 1: True. 2: False, but set direction of travel to stationary
         elif self.get_attr(ATTR_LOCATION_CURRENT) == self.get_attr(
             ATTR_LOCATION_PREVIOUS
         ):
             _LOGGER.info(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") Not performing update because coordinates are identical"
+                "(%s) Not performing update because coordinates are identical",
+                name,
             )
             proceed_with_update = 2
             # 0: False. 1: True. 2: False, but set direction of travel to stationary
@@ -944,211 +1118,225 @@ class Places(SensorEntity):
         #    # 0: False. 1: True. 2: False, but set direction of travel to stationary
         #    _LOGGER.info(
         #        "("
-        #        + self.get_attr(CONF_NAME)
+        #        + name
         #        + ") Allowing update after 3 skips even with distance traveled < 10m"
         #    )
-        elif int(self.get_attr(ATTR_DISTANCE_TRAVELED_M)) < 10:
+        elif distance_traveled < 10:
             # self.set_attr(ATTR_UPDATES_SKIPPED, self.get_attr(ATTR_UPDATES_SKIPPED) + 1)
             _LOGGER.info(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") Not performing update, distance traveled from last update is less than 10 m ("
-                + str(round(self.get_attr(ATTR_DISTANCE_TRAVELED_M), 1))
-                + " m)"
-                # + " ("
-                # + str(self.get_attr(ATTR_UPDATES_SKIPPED))
-                # + ")"
+                "(%s) Not performing update, distance traveled from last update is less than 10 m (%s m)",
+                name,
+                round(distance_traveled, 1),
             )
             proceed_with_update = 2
             # 0: False. 1: True. 2: False, but set direction of travel to stationary
         return proceed_with_update
 
-    def get_dict_from_url(self, url, name):
-        get_dict = {}
-        _LOGGER.info(
-            "(" + self.get_attr(CONF_NAME) + ") Requesting data for " + str(name)
-        )
-        _LOGGER.debug(
-            "(" + self.get_attr(CONF_NAME) + ") " + str(name) + " URL: " + str(url)
-        )
-        try:
-            get_response = requests.get(url)
-        except requests.exceptions.Timeout as e:
-            get_response = None
-            _LOGGER.warning(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") Timeout connecting to "
-                + str(name)
-                + " [Error: "
-                + str(e)
-                + "]: "
-                + str(url)
-            )
-            return {}
-        except OSError as e:
-            # Includes error code 101, network unreachable
-            get_response = None
-            _LOGGER.warning(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") Network unreachable error when connecting to "
-                + str(name)
-                + " ["
-                + str(e)
-                + "]: "
-                + str(url)
+    async def get_dict_from_url(self, url, name, rate_limiter=None):
+        """Return the JSON dict from url, retrying transient failures.
+
+        rate_limiter, if given, is acquired before every attempt, retries included.
+        """
+        sensor_name = self.get_attr(CONF_NAME)
+        _LOGGER.info("(%s) Requesting data for %s", sensor_name, name)
+        _LOGGER.debug("(%s) %s URL: %s", sensor_name, name, url)
+        get_json_input = b""
+        for attempt in range(HTTP_RETRY_TOTAL + 1):
+            if rate_limiter is not None:
+                await rate_limiter.acquire()
+            retry_reason = None
+            retry_after = None
+            try:
+                async with self._session.get(
+                    url, timeout=aiohttp.ClientTimeout(total=10)
+                ) as get_response:
+                    if get_response.ok:
+                        get_json_input = await get_response.read()
+                    elif get_response.status in HTTP_RETRY_STATUSES:
+                        retry_reason = "HTTP %s" % get_response.status
+                        retry_after = _retry_after_seconds(
+                            get_response.headers.get("Retry-After")
+                        )
+            except asyncio.TimeoutError as e:
+                _LOGGER.warning(
+                    "(%s) Timeout connecting to %s [Error: %s]: %s",
+                    sensor_name,
+                    name,
+                    e,
+                    url,
+                )
+                return {}
+            except aiohttp.ClientConnectorError as e:
+                # Also an OSError, the host couldn't be reached so don't retry
+                _LOGGER.warning(
+                    "(%s) Network unreachable error when connecting to %s [%s]: %s",
+                    sensor_name,
+                    name,
+                    e,
+                    url,
+                )
+                return {}
+            except aiohttp.ClientConnectionError as e:
+                # Dropped connections and resets, retried like the statuses
+                if attempt == HTTP_RETRY_TOTAL:
+                    _LOGGER.warning(
+                        "(%s) Connection Error connecting to %s [Error: %s]: %s",
+                        sensor_name,
+                        name,
+                        e,
+                        url,
+                    )
+                    return {}
+                retry_reason = repr(e)
+            except OSError as e:
+                # Includes error code 101, network unreachable
+                _LOGGER.warning(
+                    "(%s) Network unreachable error when connecting to %s [%s]: %s",
+                    sensor_name,
+                    name,
+                    e,
+                    url,
+                )
+                return {}
+            except aiohttp.ClientError as e:
+                _LOGGER.warning(
+                    "(%s) Connection Error connecting to %s [Error: %s]: %s",
+                    sensor_name,
+                    name,
+                    e,
+                    url,
+                )
+                return {}
+            except Exception as e:
+                _LOGGER.warning(
+                    "(%s) Unknown Exception connecting to %s [Error: %s]: %s",
+                    sensor_name,
+                    name,
+                    e,
+                    url,
+                )
+                return {}
+            if retry_reason is None or attempt == HTTP_RETRY_TOTAL:
+                break
+            delay = HTTP_RETRY_BACKOFF_SECONDS * 2**attempt
+            if retry_after is not None:
+                delay = max(delay, retry_after)
+            if delay > HTTP_RETRY_AFTER_MAX_SECONDS:
+                _LOGGER.warning(
+                    "(%s) %s failed with %s and asked to wait %ss, not retrying",
+                    sensor_name,
+                    name,
+                    retry_reason,
+                    delay,
+                )
+                break
+            _LOGGER.debug(
+                "(%s) %s failed with %s, retrying in %ss",
+                sensor_name,
+                name,
+                retry_reason,
+                delay,
             )
+            await asyncio.sleep(delay)
+
+        # Left empty by a non-OK response or an empty body
+        if not get_json_input:
             return {}
-        except NewConnectionError as e:
-            get_response = None
-            _LOGGER.warning(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") Connection Error connecting to "
-                + str(name)
-                + " [Error: "
-                + str(e)
-                + "]: "
-                + str(url)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "(%s) %s Response: %s",
+                sensor_name,
+                name,
+                get_json_input.decode("utf-8", errors="replace"),
             )
-            return {}
-        except Exception as e:
-            get_response = None
+        try:
+            get_dict = _json_loads(get_json_input)
+        except json.decoder.JSONDecodeError as e:
+            # orjson.JSONDecodeError is a subclass of this
             _LOGGER.warning(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") Unknown Exception connecting to "
-                + str(name)
-                + " [Error: "
-                + str(e)
-                + "]: "
-                + str(url)
+                "(%s) JSON Decode Error with %s info [Error: %s]: %s",
+                sensor_name,
+                name,
+                e,
+                get_json_input.decode("utf-8", errors="replace"),
             )
             return {}
-
-        get_json_input = {}
-        if get_response is not None and get_response:
-            get_json_input = get_response.text
-            _LOGGER.debug(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") "
-                + str(name)
-                + " Response: "
-                + get_json_input
-            )
-
-        if get_json_input is not None and get_json_input:
-            try:
-                get_dict = json.loads(get_json_input)
-            except json.decoder.JSONDecodeError as e:
-                _LOGGER.warning(
-                    "("
-                    + self.get_attr(CONF_NAME)
-                    + ") JSON Decode Error with "
-                    + str(name)
-                    + " info [Error: "
-                    + str(e)
-                    + "]: "
-                    + str(get_json_input)
-                )
-                return {}
         if "error_message" in get_dict:
             _LOGGER.warning(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") An error occurred contacting the web service for "
-                + str(name)
-                + ": "
-                + str(get_dict.get("error_message"))
+                "(%s) An error occurred contacting the web service for %s: %s",
+                sensor_name,
+                name,
+                get_dict.get("error_message"),
             )
             return {}
         return get_dict
 
-    def get_map_link(self):
+    async def get_cached_dict_from_url(self, cache_key, url, name):
+        """Return the dict for url, reusing a recent response shared by all sensors."""
+        cached = _OSM_CACHE.get(cache_key)
+        if cached is not None:
+            if time.monotonic() - cached[0] < OSM_CACHE_TTL_SECONDS:
+                _OSM_CACHE.move_to_end(cache_key)
+                _LOGGER.debug("(%s) Using cached %s", self.get_attr(CONF_NAME), name)
+                return cached[1]
+            _OSM_CACHE.pop(cache_key, None)
+
+        get_dict = await self.get_dict_from_url(
+            url, name, self._hass.data.get(DOMAIN, {}).get(OSM_RATE_LIMITER)
+        )
+        if get_dict:
+            _OSM_CACHE[cache_key] = (time.monotonic(), get_dict)
+            _OSM_CACHE.move_to_end(cache_key)
+            while len(_OSM_CACHE) > OSM_CACHE_MAX_ENTRIES:
+                _OSM_CACHE.popitem(last=False)
+        return get_dict
 
-        if self.get_attr(CONF_MAP_PROVIDER) == "google":
-            self.set_attr(
-                ATTR_MAP_LINK,
-                (
-                    "https://maps.google.com/?q="
-                    + str(self.get_attr(ATTR_LOCATION_CURRENT))
-                    + "&ll="
-                    + str(self.get_attr(ATTR_LOCATION_CURRENT))
-                    + "&z="
-                    + str(self.get_attr(CONF_MAP_ZOOM))
-                ),
-            )
-        elif self.get_attr(CONF_MAP_PROVIDER) == "osm":
-            self.set_attr(
-                ATTR_MAP_LINK,
-                (
-                    "https://www.openstreetmap.org/?mlat="
-                    + str(self.get_attr(ATTR_LATITUDE))
-                    + "&mlon="
-                    + str(self.get_attr(ATTR_LONGITUDE))
-                    + "#map="
-                    + str(self.get_attr(CONF_MAP_ZOOM))
-                    + "/"
-                    + str(self.get_attr(ATTR_LATITUDE))[:8]
-                    + "/"
-                    + str(self.get_attr(ATTR_LONGITUDE))[:9]
-                ),
-            )
-        else:
-            self.set_attr(
-                ATTR_MAP_LINK,
-                (
-                    "https://maps.apple.com/maps/?q="
-                    + str(self.get_attr(ATTR_LOCATION_CURRENT))
-                    + "&z="
-                    + str(self.get_attr(CONF_MAP_ZOOM))
-                ),
-            )
+    def get_map_link(self):
+        lat = str(self.get_attr(ATTR_LATITUDE))
+        lon = str(self.get_attr(ATTR_LONGITUDE))
+        template = _MAP_URL_TEMPLATES.get(
+            self.get_attr(CONF_MAP_PROVIDER), _MAP_URL_TEMPLATES["apple"]
+        )
+        self.set_attr(
+            ATTR_MAP_LINK,
+            template.format_map(
+                {
+                    "loc": str(self.get_attr(ATTR_LOCATION_CURRENT)),
+                    "zoom": str(self.get_attr(CONF_MAP_ZOOM)),
+                    "lat": lat,
+                    "lon": lon,
+                    "lat8": lat[:8],
+                    "lon9": lon[:9],
+                }
+            ),
+        )
         _LOGGER.debug(
-            "("
-            + self.get_attr(CONF_NAME)
-            + ") Map Link Type: "
-            + str(self.get_attr(CONF_MAP_PROVIDER))
+            "(%s) Map Link Type: %s",
+            self.get_attr(CONF_NAME),
+            self.get_attr(CONF_MAP_PROVIDER),
         )
         _LOGGER.debug(
-            "("
-            + self.get_attr(CONF_NAME)
-            + ") Map Link URL: "
-            + str(self.get_attr(ATTR_MAP_LINK))
+            "(%s) Map Link URL: %s",
+            self.get_attr(CONF_NAME),
+            self.get_attr(ATTR_MAP_LINK),
         )
 
     def get_gps_accuracy(self):
-        if (
-            self._hass.states.get(self.get_attr(CONF_DEVICETRACKER_ID))
-            and self._hass.states.get(self.get_attr(CONF_DEVICETRACKER_ID)).attributes
-            and ATTR_GPS_ACCURACY
-            in self._hass.states.get(self.get_attr(CONF_DEVICETRACKER_ID)).attributes
-            and self._hass.states.get(
-                self.get_attr(CONF_DEVICETRACKER_ID)
-            ).attributes.get(ATTR_GPS_ACCURACY)
-            is not None
-            and self.is_float(
-                self._hass.states.get(
-                    self.get_attr(CONF_DEVICETRACKER_ID)
-                ).attributes.get(ATTR_GPS_ACCURACY)
-            )
-        ):
-            self.set_attr(
-                ATTR_GPS_ACCURACY,
-                float(
-                    self._hass.states.get(
-                        self.get_attr(CONF_DEVICETRACKER_ID)
-                    ).attributes.get(ATTR_GPS_ACCURACY)
-                ),
-            )
+        devicetracker_state = self._hass.states.get(
+            self.get_attr(CONF_DEVICETRACKER_ID)
+        )
+        gps_accuracy = (
+            devicetracker_state.attributes.get(ATTR_GPS_ACCURACY)
+            if devicetracker_state
+            else None
+        )
+        if gps_accuracy is not None and self.is_float(gps_accuracy):
+            self.set_attr(ATTR_GPS_ACCURACY, float(gps_accuracy))
         else:
             _LOGGER.debug(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") GPS Accuracy attribute not found in: "
-                + str(self.get_attr(CONF_DEVICETRACKER_ID))
+                "(%s) GPS Accuracy attribute not found in: %s",
+                self.get_attr(CONF_NAME),
+                self.get_attr(CONF_DEVICETRACKER_ID),
             )
         proceed_with_update = 1
         # 0: False. 1: True. 2: False, but set direction of travel to stationary
@@ -1158,16 +1346,14 @@ class Places(SensorEntity):
                 proceed_with_update = 0
                 # 0: False. 1: True. 2: False, but set direction of travel to stationary
                 _LOGGER.info(
-                    "("
-                    + self.get_attr(CONF_NAME)
-                    + ") GPS Accuracy is 0.0, not performing update"
+                    "(%s) GPS Accuracy is 0.0, not performing update",
+                    self.get_attr(CONF_NAME),
                 )
             else:
                 _LOGGER.debug(
-                    "("
-                    + self.get_attr(CONF_NAME)
-                    + ") GPS Accuracy: "
-                    + str(round(self.get_attr(ATTR_GPS_ACCURACY), 3))
+                    "(%s) GPS Accuracy: %s",
+                    self.get_attr(CONF_NAME),
+                    round(self.get_attr(ATTR_GPS_ACCURACY), 3),
                 )
         return proceed_with_update
 
@@ -1184,664 +1370,419 @@ class Places(SensorEntity):
             self.set_attr(ATTR_DRIVING, "Driving")
 
     def parse_osm_dict(self):
-        if "type" in self.get_attr(ATTR_OSM_DICT):
-            self.set_attr(ATTR_PLACE_TYPE, self.get_attr(ATTR_OSM_DICT).get("type"))
-            if self.get_attr(ATTR_PLACE_TYPE) == "yes":
-                if "addresstype" in self.get_attr(ATTR_OSM_DICT):
-                    self.set_attr(
-                        ATTR_PLACE_TYPE,
-                        self.get_attr(ATTR_OSM_DICT).get("addresstype"),
-                    )
+        ia = self._internal_attr
+        name = self.get_attr(CONF_NAME)
+        osm = ia.get(ATTR_OSM_DICT)
+        addr = osm.get("address") or {}
+        names = osm.get("namedetails") or {}
+        if "type" in osm:
+            self.set_attr(ATTR_PLACE_TYPE, osm.get("type"))
+            if ia.get(ATTR_PLACE_TYPE) == "yes":
+                if "addresstype" in osm:
+                    self.set_attr(ATTR_PLACE_TYPE, osm.get("addresstype"))
                 else:
                     self.clear_attr(ATTR_PLACE_TYPE)
-            if "address" in self.get_attr(ATTR_OSM_DICT) and self.get_attr(
-                ATTR_PLACE_TYPE
-            ) in self.get_attr(ATTR_OSM_DICT).get("address"):
-                self.set_attr(
-                    ATTR_PLACE_NAME,
-                    self.get_attr(ATTR_OSM_DICT)
-                    .get("address")
-                    .get(self.get_attr(ATTR_PLACE_TYPE)),
-                )
-        if "category" in self.get_attr(ATTR_OSM_DICT):
-            self.set_attr(
-                ATTR_PLACE_CATEGORY,
-                self.get_attr(ATTR_OSM_DICT).get("category"),
-            )
-            if "address" in self.get_attr(ATTR_OSM_DICT) and self.get_attr(
-                ATTR_PLACE_CATEGORY
-            ) in self.get_attr(ATTR_OSM_DICT).get("address"):
-                self.set_attr(
-                    ATTR_PLACE_NAME,
-                    self.get_attr(ATTR_OSM_DICT)
-                    .get("address")
-                    .get(self.get_attr(ATTR_PLACE_CATEGORY)),
-                )
-        if "namedetails" in self.get_attr(ATTR_OSM_DICT) and "name" in self.get_attr(
-            ATTR_OSM_DICT
-        ).get("namedetails"):
+            if ia.get(ATTR_PLACE_TYPE) in addr:
+                self.set_attr(ATTR_PLACE_NAME, addr.get(ia.get(ATTR_PLACE_TYPE)))
+        if "category" in osm:
+            self.set_attr(ATTR_PLACE_CATEGORY, osm.get("category"))
+            if ia.get(ATTR_PLACE_CATEGORY) in addr:
+                self.set_attr(ATTR_PLACE_NAME, addr.get(ia.get(ATTR_PLACE_CATEGORY)))
+        if "name" in names:
+            self.set_attr(ATTR_PLACE_NAME, names.get("name"))
+        for key in self._language_keys:
+            if key in names:
+                self.set_attr(ATTR_PLACE_NAME, names.get(key))
+                break
+        # if not self.in_zone() and ia.get(ATTR_PLACE_NAME) != "house":
+        #    self.set_attr(ATTR_NATIVE_VALUE, ia.get(ATTR_PLACE_NAME))
+
+        for key, attr, transform in _OSM_ADDRESS_FIELDS:
+            if key in addr:
+                value = addr.get(key)
+                self.set_attr(attr, transform(value) if transform else value)
+        if (
+            self.is_attr_blank(ATTR_PLACE_NAME)
+            or (
+                not self.is_attr_blank(ATTR_PLACE_CATEGORY)
+                and not self.is_attr_blank(ATTR_STREET)
+                and ia.get(ATTR_PLACE_CATEGORY) == "highway"
+                and ia.get(ATTR_STREET) == ia.get(ATTR_PLACE_NAME)
+            )
+        ) and "retail" in addr:
+            self.set_attr(ATTR_PLACE_NAME, addr.get("retail"))
+        _LOGGER.debug("(%s) Place Name: %s", name, ia.get(ATTR_PLACE_NAME))
+
+        for attr, keys in _OSM_ADDRESS_FALLBACKS:
+            key = next((k for k in keys if k in addr), None)
+            if key is not None:
+                self.set_attr(attr, addr.get(key))
+        if not self.is_attr_blank(ATTR_CITY):
             self.set_attr(
-                ATTR_PLACE_NAME,
-                self.get_attr(ATTR_OSM_DICT).get("namedetails").get("name"),
+                ATTR_CITY_CLEAN,
+                ia.get(ATTR_CITY).replace(" Township", "").strip(),
             )
-        if not self.is_attr_blank(CONF_LANGUAGE):
-            for language in self.get_attr(CONF_LANGUAGE).split(","):
-                if "name:" + language in self.get_attr(ATTR_OSM_DICT).get(
-                    "namedetails"
-                ):
-                    self.set_attr(
-                        ATTR_PLACE_NAME,
-                        self.get_attr(ATTR_OSM_DICT)
-                        .get("namedetails")
-                        .get("name:" + language),
-                    )
-                    break
-        # if not self.in_zone() and self.get_attr(ATTR_PLACE_NAME) != "house":
-        #    self.set_attr(ATTR_NATIVE_VALUE, self.get_attr(ATTR_PLACE_NAME))
+            if ia.get(ATTR_CITY_CLEAN).startswith("City of"):
+                self.set_attr(ATTR_CITY_CLEAN, ia.get(ATTR_CITY_CLEAN)[8:] + " City")
+
+        if "display_name" in osm:
+            self.set_attr(ATTR_FORMATTED_ADDRESS, osm.get("display_name"))
+
+        if "osm_id" in osm:
+            self.set_attr(ATTR_OSM_ID, str(osm.get("osm_id")))
+        if "osm_type" in osm:
+            self.set_attr(ATTR_OSM_TYPE, osm.get("osm_type"))
 
-        if "house_number" in self.get_attr(ATTR_OSM_DICT).get("address"):
-            self.set_attr(
-                ATTR_STREET_NUMBER,
-                (self.get_attr(ATTR_OSM_DICT).get("address").get("house_number")),
-            )
-        if "road" in self.get_attr(ATTR_OSM_DICT).get("address"):
-            self.set_attr(
-                ATTR_STREET,
-                self.get_attr(ATTR_OSM_DICT).get("address").get("road"),
-            )
         if (
-            (
-                self.is_attr_blank(ATTR_PLACE_NAME)
-                or (
-                    not self.is_attr_blank(ATTR_PLACE_CATEGORY)
-                    and not self.is_attr_blank(ATTR_STREET)
-                    and self.get_attr(ATTR_PLACE_CATEGORY) == "highway"
-                    and self.get_attr(ATTR_STREET) == self.get_attr(ATTR_PLACE_NAME)
+            not self.is_attr_blank(ATTR_PLACE_CATEGORY)
+            and ia.get(ATTR_PLACE_CATEGORY).lower() == "highway"
+            and "ref" in names
+        ):
+            street_refs = _STREET_REF_SPLIT.split(names.get("ref"))
+            _LOGGER.debug("(%s) Street Refs: %s", name, street_refs)
+            for ref in street_refs:
+                # A ref containing a digit is never blank
+                if _HAS_DIGIT.search(ref):
+                    self.set_attr(ATTR_STREET_REF, ref)
+                    break
+            if not self.is_attr_blank(ATTR_STREET_REF):
+                _LOGGER.debug(
+                    "(%s) Street: %s / Street Ref: %s",
+                    name,
+                    ia.get(ATTR_STREET),
+                    ia.get(ATTR_STREET_REF),
                 )
-            )
-            and "address" in self.get_attr(ATTR_OSM_DICT)
-            and "retail" in self.get_attr(ATTR_OSM_DICT).get("address")
+        # Reused by build_formatted_place, nothing in between changes these
+        self._duplicate_values = {
+            ia.get(attr)
+            for attr in PLACE_NAME_DUPLICATE_LIST
+            if not self.is_attr_blank(attr)
+        }
+        if (
+            not self.is_attr_blank(ATTR_PLACE_NAME)
+            and ia.get(ATTR_PLACE_NAME) not in self._duplicate_values
         ):
-            self.set_attr(
-                ATTR_PLACE_NAME,
-                self.get_attr(ATTR_OSM_DICT).get("address").get("retail"),
-            )
+            self.set_attr(ATTR_PLACE_NAME_NO_DUPE, ia.get(ATTR_PLACE_NAME))
+
         _LOGGER.debug(
-            "("
-            + self.get_attr(CONF_NAME)
-            + ") Place Name: "
-            + str(self.get_attr(ATTR_PLACE_NAME))
-        )
-
-        if "neighbourhood" in self.get_attr(ATTR_OSM_DICT).get("address"):
-            self.set_attr(
-                ATTR_PLACE_NEIGHBOURHOOD,
-                self.get_attr(ATTR_OSM_DICT).get("address").get("neighbourhood"),
-            )
-        elif "hamlet" in self.get_attr(ATTR_OSM_DICT).get("address"):
-            self.set_attr(
-                ATTR_PLACE_NEIGHBOURHOOD,
-                self.get_attr(ATTR_OSM_DICT).get("address").get("hamlet"),
-            )
-        elif "residential" in self.get_attr(ATTR_OSM_DICT).get("address"):
-            self.set_attr(
-                ATTR_PLACE_NEIGHBOURHOOD,
-                self.get_attr(ATTR_OSM_DICT).get("address").get("residential"),
-            )
-
-        if "city" in self.get_attr(ATTR_OSM_DICT).get("address"):
-            self.set_attr(
-                ATTR_CITY,
-                self.get_attr(ATTR_OSM_DICT).get("address").get("city"),
-            )
-        elif "town" in self.get_attr(ATTR_OSM_DICT).get("address"):
-            self.set_attr(
-                ATTR_CITY,
-                self.get_attr(ATTR_OSM_DICT).get("address").get("town"),
-            )
-        elif "village" in self.get_attr(ATTR_OSM_DICT).get("address"):
-            self.set_attr(
-                ATTR_CITY,
-                self.get_attr(ATTR_OSM_DICT).get("address").get("village"),
-            )
-        elif "township" in self.get_attr(ATTR_OSM_DICT).get("address"):
-            self.set_attr(
-                ATTR_CITY,
-                self.get_attr(ATTR_OSM_DICT).get("address").get("township"),
-            )
-        elif "municipality" in self.get_attr(ATTR_OSM_DICT).get("address"):
-            self.set_attr(
-                ATTR_CITY,
-                self.get_attr(ATTR_OSM_DICT).get("address").get("municipality"),
-            )
-        elif "city_district" in self.get_attr(ATTR_OSM_DICT).get("address"):
-            self.set_attr(
-                ATTR_CITY,
-                self.get_attr(ATTR_OSM_DICT).get("address").get("city_district"),
-            )
-        if not self.is_attr_blank(ATTR_CITY):
-            self.set_attr(
-                ATTR_CITY_CLEAN,
-                self.get_attr(ATTR_CITY).replace(" Township", "").strip(),
-            )
-            if self.get_attr(ATTR_CITY_CLEAN).startswith("City of"):
-                self.set_attr(
-                    ATTR_CITY_CLEAN, self.get_attr(ATTR_CITY_CLEAN)[8:] + " City"
-                )
-
-        if "city_district" in self.get_attr(ATTR_OSM_DICT).get("address"):
-            self.set_attr(
-                ATTR_POSTAL_TOWN,
-                self.get_attr(ATTR_OSM_DICT).get("address").get("city_district"),
-            )
-        if "suburb" in self.get_attr(ATTR_OSM_DICT).get("address"):
-            self.set_attr(
-                ATTR_POSTAL_TOWN,
-                self.get_attr(ATTR_OSM_DICT).get("address").get("suburb"),
-            )
-        if "state" in self.get_attr(ATTR_OSM_DICT).get("address"):
-            self.set_attr(
-                ATTR_REGION,
-                self.get_attr(ATTR_OSM_DICT).get("address").get("state"),
-            )
-        if "ISO3166-2-lvl4" in self.get_attr(ATTR_OSM_DICT).get("address"):
-            self.set_attr(
-                ATTR_STATE_ABBR,
-                (
-                    self.get_attr(ATTR_OSM_DICT)
-                    .get("address")
-                    .get("ISO3166-2-lvl4")
-                    .split("-")[1]
-                    .upper()
-                ),
-            )
-        if "county" in self.get_attr(ATTR_OSM_DICT).get("address"):
-            self.set_attr(
-                ATTR_COUNTY,
-                self.get_attr(ATTR_OSM_DICT).get("address").get("county"),
-            )
-        if "country" in self.get_attr(ATTR_OSM_DICT).get("address"):
-            self.set_attr(
-                ATTR_COUNTRY,
-                self.get_attr(ATTR_OSM_DICT).get("address").get("country"),
-            )
-        if "country_code" in self.get_attr(ATTR_OSM_DICT).get("address"):
-            self.set_attr(
-                ATTR_COUNTRY_CODE,
-                self.get_attr(ATTR_OSM_DICT).get("address").get("country_code").upper(),
-            )
-        if "postcode" in self.get_attr(ATTR_OSM_DICT).get("address"):
-            self.set_attr(
-                ATTR_POSTAL_CODE,
-                self.get_attr(ATTR_OSM_DICT).get("address").get("postcode"),
-            )
-        if "display_name" in self.get_attr(ATTR_OSM_DICT):
-            self.set_attr(
-                ATTR_FORMATTED_ADDRESS,
-                self.get_attr(ATTR_OSM_DICT).get("display_name"),
-            )
-
-        if "osm_id" in self.get_attr(ATTR_OSM_DICT):
-            self.set_attr(ATTR_OSM_ID, str(self.get_attr(ATTR_OSM_DICT).get("osm_id")))
-        if "osm_type" in self.get_attr(ATTR_OSM_DICT):
-            self.set_attr(ATTR_OSM_TYPE, self.get_attr(ATTR_OSM_DICT).get("osm_type"))
-
-        if (
-            not self.is_attr_blank(ATTR_PLACE_CATEGORY)
-            and self.get_attr(ATTR_PLACE_CATEGORY).lower() == "highway"
-            and "namedetails" in self.get_attr(ATTR_OSM_DICT)
-            and "ref" in self.get_attr(ATTR_OSM_DICT).get("namedetails")
-        ):
-            street_refs = re.split(
-                r"[\;\\\/\,\.\:]",
-                self.get_attr(ATTR_OSM_DICT).get("namedetails").get("ref"),
-            )
-            street_refs = [i for i in street_refs if i.strip()]  # Remove blank strings
-            _LOGGER.debug(
-                "(" + self.get_attr(CONF_NAME) + ") Street Refs: " + str(street_refs)
-            )
-            for ref in street_refs:
-                if bool(re.search(r"\d", ref)):
-                    self.set_attr(ATTR_STREET_REF, ref)
-                    break
-            if not self.is_attr_blank(ATTR_STREET_REF):
-                _LOGGER.debug(
-                    "("
-                    + self.get_attr(CONF_NAME)
-                    + ") Street: "
-                    + str(self.get_attr(ATTR_STREET))
-                    + " / Street Ref: "
-                    + str(self.get_attr(ATTR_STREET_REF))
-                )
-        dupe_attributes_check = []
-        for attr in PLACE_NAME_DUPLICATE_LIST:
-            if not self.is_attr_blank(attr):
-                dupe_attributes_check.append(self.get_attr(attr))
-        if (
-            not self.is_attr_blank(ATTR_PLACE_NAME)
-            and self.get_attr(ATTR_PLACE_NAME) not in dupe_attributes_check
-        ):
-            self.set_attr(ATTR_PLACE_NAME_NO_DUPE, self.get_attr(ATTR_PLACE_NAME))
-
-        _LOGGER.debug(
-            "("
-            + self.get_attr(CONF_NAME)
-            + ") Entity attributes after parsing OSM Dict: "
-            + str(self._internal_attr)
+            "(%s) Entity attributes after parsing OSM Dict: %s",
+            name,
+            self._internal_attr,
         )
 
     def build_formatted_place(self):
+        ia = self._internal_attr
+        name = self.get_attr(CONF_NAME)
         formatted_place_array = []
         if not self.in_zone():
-            if not self.is_attr_blank(ATTR_DRIVING) and "driving" in self.get_attr(
+            if not self.is_attr_blank(ATTR_DRIVING) and "driving" in ia.get(
                 ATTR_DISPLAY_OPTIONS_LIST
             ):
-                formatted_place_array.append(self.get_attr(ATTR_DRIVING))
+                formatted_place_array.append(ia.get(ATTR_DRIVING))
+            ptype = (ia.get(ATTR_PLACE_TYPE) or "").lower()
+            pcat = (ia.get(ATTR_PLACE_CATEGORY) or "").lower()
             # Don't use place name if the same as another attributes
             use_place_name = True
-            sensor_attributes_values = []
-            for attr in PLACE_NAME_DUPLICATE_LIST:
-                if not self.is_attr_blank(attr):
-                    sensor_attributes_values.append(self.get_attr(attr))
             # if not self.is_attr_blank(ATTR_PLACE_NAME):
             # _LOGGER.debug(
             #    "("
-            #    + self.get_attr(CONF_NAME)
+            #    + name
             #    + ") Duplicated List [Place Name: "
-            #    + str(self.get_attr(ATTR_PLACE_NAME))
+            #    + str(ia.get(ATTR_PLACE_NAME))
             #    + " ]: "
-            #    + str(sensor_attributes_values)
+            #    + str(self._duplicate_values)
             # )
             if self.is_attr_blank(ATTR_PLACE_NAME):
                 use_place_name = False
-                # _LOGGER.debug("(" + self.get_attr(CONF_NAME) + ") Place Name is None")
-            elif self.get_attr(ATTR_PLACE_NAME) in sensor_attributes_values:
+                # _LOGGER.debug("(" + name + ") Place Name is None")
+            elif ia.get(ATTR_PLACE_NAME) in self._duplicate_values:
                 # _LOGGER.debug(
                 #    "("
-                #    + self.get_attr(CONF_NAME)
+                #    + name
                 #    + ") Not Using Place Name: "
-                #    + str(self.get_attr(ATTR_PLACE_NAME))
+                #    + str(ia.get(ATTR_PLACE_NAME))
                 # )
                 use_place_name = False
-            _LOGGER.debug(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") use_place_name: "
-                + str(use_place_name)
-            )
+            _LOGGER.debug("(%s) use_place_name: %s", name, use_place_name)
             if not use_place_name:
                 if (
                     not self.is_attr_blank(ATTR_PLACE_TYPE)
-                    and self.get_attr(ATTR_PLACE_TYPE).lower() != "unclassified"
-                    and self.get_attr(ATTR_PLACE_CATEGORY).lower() != "highway"
+                    and ptype != "unclassified"
+                    and pcat != "highway"
                 ):
                     formatted_place_array.append(
-                        self.get_attr(ATTR_PLACE_TYPE)
+                        ia.get(ATTR_PLACE_TYPE)
                         .title()
                         .replace("Proposed", "")
                         .replace("Construction", "")
                         .strip()
                     )
-                elif (
-                    not self.is_attr_blank(ATTR_PLACE_CATEGORY)
-                    and self.get_attr(ATTR_PLACE_CATEGORY).lower() != "highway"
-                ):
+                elif not self.is_attr_blank(ATTR_PLACE_CATEGORY) and pcat != "highway":
                     formatted_place_array.append(
-                        self.get_attr(ATTR_PLACE_CATEGORY).title().strip()
+                        ia.get(ATTR_PLACE_CATEGORY).title().strip()
                     )
                 street = None
                 if self.is_attr_blank(ATTR_STREET) and not self.is_attr_blank(
                     ATTR_STREET_REF
                 ):
-                    street = self.get_attr(ATTR_STREET_REF).strip()
-                    _LOGGER.debug(
-                        "("
-                        + self.get_attr(CONF_NAME)
-                        + ") Using street_ref: "
-                        + str(street)
-                    )
+                    street = ia.get(ATTR_STREET_REF).strip()
+                    _LOGGER.debug("(%s) Using street_ref: %s", name, street)
                 elif not self.is_attr_blank(ATTR_STREET):
                     if (
                         not self.is_attr_blank(ATTR_PLACE_CATEGORY)
-                        and self.get_attr(ATTR_PLACE_CATEGORY).lower() == "highway"
+                        and pcat == "highway"
                         and not self.is_attr_blank(ATTR_PLACE_TYPE)
-                        and self.get_attr(ATTR_PLACE_TYPE).lower()
-                        in ["motorway", "trunk"]
+                        and ptype in ["motorway", "trunk"]
                         and not self.is_attr_blank(ATTR_STREET_REF)
                     ):
-                        street = self.get_attr(ATTR_STREET_REF).strip()
-                        _LOGGER.debug(
-                            "("
-                            + self.get_attr(CONF_NAME)
-                            + ") Using street_ref: "
-                            + str(street)
-                        )
+                        street = ia.get(ATTR_STREET_REF).strip()
+                        _LOGGER.debug("(%s) Using street_ref: %s", name, street)
                     else:
-                        street = self.get_attr(ATTR_STREET).strip()
-                        _LOGGER.debug(
-                            "("
-                            + self.get_attr(CONF_NAME)
-                            + ") Using street: "
-                            + str(street)
-                        )
+                        street = ia.get(ATTR_STREET).strip()
+                        _LOGGER.debug("(%s) Using street: %s", name, street)
                 if street and self.is_attr_blank(ATTR_STREET_NUMBER):
                     formatted_place_array.append(street)
                 elif street and not self.is_attr_blank(ATTR_STREET_NUMBER):
                     formatted_place_array.append(
-                        str(self.get_attr(ATTR_STREET_NUMBER)).strip()
-                        + " "
-                        + str(street)
+                        str(ia.get(ATTR_STREET_NUMBER)).strip() + " " + str(street)
                     )
                 if (
                     not self.is_attr_blank(ATTR_PLACE_TYPE)
-                    and self.get_attr(ATTR_PLACE_TYPE).lower() == "house"
+                    and ptype == "house"
                     and not self.is_attr_blank(ATTR_PLACE_NEIGHBOURHOOD)
                 ):
                     formatted_place_array.append(
-                        self.get_attr(ATTR_PLACE_NEIGHBOURHOOD).strip()
+                        ia.get(ATTR_PLACE_NEIGHBOURHOOD).strip()
                     )
 
             else:
-                formatted_place_array.append(self.get_attr(ATTR_PLACE_NAME).strip())
+                formatted_place_array.append(ia.get(ATTR_PLACE_NAME).strip())
             if not self.is_attr_blank(ATTR_CITY):
                 formatted_place_array.append(
-                    self.get_attr(ATTR_CITY).replace(" Township", "").strip()
+                    ia.get(ATTR_CITY).replace(" Township", "").strip()
                 )
             elif not self.is_attr_blank(ATTR_COUNTY):
-                formatted_place_array.append(self.get_attr(ATTR_COUNTY).strip())
+                formatted_place_array.append(ia.get(ATTR_COUNTY).strip())
             if not self.is_attr_blank(ATTR_STATE_ABBR):
-                formatted_place_array.append(self.get_attr(ATTR_STATE_ABBR))
+                formatted_place_array.append(ia.get(ATTR_STATE_ABBR))
         else:
-            formatted_place_array.append(
-                self.get_attr(ATTR_DEVICETRACKER_ZONE_NAME).strip()
-            )
-        formatted_place = ", ".join(item for item in formatted_place_array)
-        formatted_place = formatted_place.replace("\n", " ").replace("  ", " ").strip()
+            formatted_place_array.append(ia.get(ATTR_DEVICETRACKER_ZONE_NAME).strip())
+        # Skip blank parts and collapse newlines and runs of whitespace in one pass
+        formatted_place = _MULTISPACE.sub(
+            " ", ", ".join(filter(None, formatted_place_array))
+        ).strip()
         self.set_attr(ATTR_FORMATTED_PLACE, formatted_place)
 
     def build_from_advanced_options(self, curr_options):
-        _LOGGER.debug(
-            "("
-            + self.get_attr(CONF_NAME)
-            + ") [adv_options] Options: "
-            + str(curr_options)
-        )
-        if curr_options.count("[") != curr_options.count("]"):
-            _LOGGER.error(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") [adv_options] Bracket Count Mismatch: "
-                + str(curr_options)
-            )
-            return
-        elif curr_options.count("(") != curr_options.count(")"):
-            _LOGGER.error(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") [adv_options] Parenthesis Count Mismatch: "
-                + str(curr_options)
-            )
-            return
-        incl = []
-        excl = []
-        incl_attr = {}
-        excl_attr = {}
-        none_opt = None
-        next_opt = None
-        if curr_options is None or not curr_options:
-            return
-        elif "[" in curr_options or "(" in curr_options:
-            # _LOGGER.debug(
-            #    "("
-            #    + self.get_attr(CONF_NAME)
-            #    + ") [adv_options] Options has a [ or ( and optional ,"
-            # )
-            comma_num = curr_options.find(",")
-            bracket_num = curr_options.find("[")
-            paren_num = curr_options.find("(")
-            if (
-                comma_num != -1
-                and (bracket_num == -1 or comma_num < bracket_num)
-                and (paren_num == -1 or comma_num < paren_num)
-            ):
-                # Comma is first symbol
-                # _LOGGER.debug(
-                #    "(" + self.get_attr(CONF_NAME) + ") [adv_options] Comma is First"
-                # )
-                opt = curr_options[:comma_num]
+        # The structure of the options only depends on the string, so it is
+        # parsed once and only the option states are looked up on each update
+        parsed = _ADV_OPTIONS_CACHE.get(curr_options)
+        if parsed is None:
+            parsed = self._parse_advanced_options(curr_options)
+            if len(_ADV_OPTIONS_CACHE) < ADV_OPTIONS_CACHE_MAX_ENTRIES:
+                _ADV_OPTIONS_CACHE[curr_options] = parsed
+        self._build_from_parsed_options(parsed)
+
+    def _build_from_parsed_options(self, parsed):
+        name = self.get_attr(CONF_NAME)
+        for opt, incl, excl, incl_attr, excl_attr, fallback in parsed:
+            ret_state = self.get_option_state(opt, incl, excl, incl_attr, excl_attr)
+            if ret_state:
+                self.adv_options_state_list.append(ret_state)
                 _LOGGER.debug(
-                    "("
-                    + self.get_attr(CONF_NAME)
-                    + ") [adv_options] Option: "
-                    + str(opt)
+                    "(%s) [adv_options] Updated state list: %s",
+                    name,
+                    self.adv_options_state_list,
                 )
-                if opt is not None and opt:
-                    ret_state = self.get_option_state(opt.strip())
-                    if ret_state is not None and ret_state:
-                        self.adv_options_state_list.append(ret_state)
-                        _LOGGER.debug(
-                            "("
-                            + self.get_attr(CONF_NAME)
-                            + ") [adv_options] Updated state list: "
-                            + str(self.adv_options_state_list)
-                        )
-                next_opt = curr_options[(comma_num + 1):]
-                _LOGGER.debug(
-                    "("
-                    + self.get_attr(CONF_NAME)
-                    + ") [adv_options] Next Options: "
-                    + str(next_opt)
+            elif fallback:
+                self._build_from_parsed_options(fallback)
+
+    def _parse_advanced_options(self, curr_options):
+        """Return (option, incl, excl, incl_attr, excl_attr, fallback) tuples.
+
+        fallback is the parsed [] options used when the option has no state.
+        """
+        name = self.get_attr(CONF_NAME)
+        parsed = []
+        # Each pass parses the first option and moves on to the rest
+        while curr_options:
+            _LOGGER.debug("(%s) [adv_options] Options: %s", name, curr_options)
+            if curr_options.count("[") != curr_options.count("]"):
+                _LOGGER.error(
+                    "(%s) [adv_options] Bracket Count Mismatch: %s", name, curr_options
                 )
-                if next_opt is not None and next_opt:
-                    self.build_from_advanced_options(next_opt.strip())
-                    # _LOGGER.debug(
-                    #    "("
-                    #    + self.get_attr(CONF_NAME)
-                    #    + ") [adv_options] Back from recursion"
-                    # )
-                return
-            elif (
-                bracket_num != -1
-                and (comma_num == -1 or bracket_num < comma_num)
-                and (paren_num == -1 or bracket_num < paren_num)
+                break
+            elif curr_options.count("(") != curr_options.count(")"):
+                _LOGGER.error(
+                    "(%s) [adv_options] Parenthesis Count Mismatch: %s",
+                    name,
+                    curr_options,
+                )
+                break
+            # One scan finds the first separator, no match means a single term
+            first_symbol = _ADV_SYMBOL_RE.search(curr_options)
+            if first_symbol is not None and (
+                "[" in curr_options or "(" in curr_options
             ):
-                # Bracket is first symbol
                 # _LOGGER.debug(
-                #    "(" + self.get_attr(CONF_NAME) + ") [adv_options] Bracket is First"
+                #    "("
+                #    + self.get_attr(CONF_NAME)
+                #    + ") [adv_options] Options has a [ or ( and optional ,"
                 # )
-                opt = curr_options[:bracket_num]
-                _LOGGER.debug(
-                    "("
-                    + self.get_attr(CONF_NAME)
-                    + ") [adv_options] Option: "
-                    + str(opt)
+                next_opt = self._ADV_FIRST_SYMBOL_HANDLERS[first_symbol.group()](
+                    self, curr_options, first_symbol.start(), parsed
                 )
-                none_opt, next_opt = self.parse_bracket(curr_options[bracket_num:])
-                if (
-                    next_opt is not None
-                    and next_opt
-                    and len(next_opt) > 1
-                    and next_opt[0] == "("
-                ):
-                    # Parse Parenthesis
-                    incl, excl, incl_attr, excl_attr, next_opt = self.parse_parens(
-                        next_opt
-                    )
-
-                if opt is not None and opt:
-                    ret_state = self.get_option_state(
-                        opt.strip(), incl, excl, incl_attr, excl_attr
-                    )
-                    if ret_state is not None and ret_state:
-                        self.adv_options_state_list.append(ret_state)
-                        _LOGGER.debug(
-                            "("
-                            + self.get_attr(CONF_NAME)
-                            + ") [adv_options] Updated state list: "
-                            + str(self.adv_options_state_list)
-                        )
-                    elif none_opt is not None and none_opt:
-                        self.build_from_advanced_options(none_opt.strip())
-                        # _LOGGER.debug(
-                        #    "("
-                        #    + self.get_attr(CONF_NAME)
-                        #    + ") [adv_options] Back from recursion"
-                        # )
-
-                if (
-                    next_opt is not None
-                    and next_opt
-                    and len(next_opt) > 1
-                    and next_opt[0] == ","
-                ):
-                    next_opt = next_opt[1:]
-                    _LOGGER.debug(
-                        "("
-                        + self.get_attr(CONF_NAME)
-                        + ") [adv_options] Next Options: "
-                        + str(next_opt)
-                    )
-                    if next_opt is not None and next_opt:
-                        self.build_from_advanced_options(next_opt.strip())
-                        # _LOGGER.debug(
-                        #    "("
-                        #    + self.get_attr(CONF_NAME)
-                        #    + ") [adv_options] Back from recursion"
-                        # )
-                return
-            elif (
-                paren_num != -1
-                and (comma_num == -1 or paren_num < comma_num)
-                and (bracket_num == -1 or paren_num < bracket_num)
-            ):
-                # Parenthesis is first symbol
+                curr_options = next_opt.strip() if next_opt else None
+            elif first_symbol is not None:
+                # Only commas, the first symbol can't be anything else here
                 # _LOGGER.debug(
                 #    "("
                 #    + self.get_attr(CONF_NAME)
-                #    + ") [adv_options] Parenthesis is First"
+                #    + ") [adv_options] Options has , but no [ or (, splitting"
                 # )
-                opt = curr_options[:paren_num]
-                _LOGGER.debug(
-                    "("
-                    + self.get_attr(CONF_NAME)
-                    + ") [adv_options] Option: "
-                    + str(opt)
-                )
-                incl, excl, incl_attr, excl_attr, next_opt = self.parse_parens(
-                    curr_options[paren_num:]
-                )
-                if (
-                    next_opt is not None
-                    and next_opt
-                    and len(next_opt) > 1
-                    and next_opt[0] == "["
-                ):
-                    # Parse Bracket
-                    none_opt, next_opt = self.parse_bracket(next_opt)
+                for opt in curr_options.split(","):
+                    if opt:
+                        parsed.append((opt.strip(), None, None, None, None, None))
+                break
+            else:
+                # _LOGGER.debug(
+                #    "("
+                #    + self.get_attr(CONF_NAME)
+                #    + ") [adv_options] Options should just be a single term"
+                # )
+                parsed.append((curr_options.strip(), None, None, None, None, None))
+                break
+        return tuple(parsed)
 
-                if opt is not None and opt:
-                    ret_state = self.get_option_state(
-                        opt.strip(), incl, excl, incl_attr, excl_attr
-                    )
-                    if ret_state is not None and ret_state:
-                        self.adv_options_state_list.append(ret_state)
-                        _LOGGER.debug(
-                            "("
-                            + self.get_attr(CONF_NAME)
-                            + ") [adv_options] Updated state list: "
-                            + str(self.adv_options_state_list)
-                        )
-                    elif none_opt is not None and none_opt:
-                        self.build_from_advanced_options(none_opt.strip())
-                        # _LOGGER.debug(
-                        #    "("
-                        #    + self.get_attr(CONF_NAME)
-                        #    + ") [adv_options] Back from recursion"
-                        # )
+    # The _adv_*_first handlers take the options and the position of their first
+    # separator, add the option they parse to parsed, and return the options
+    # still left to parse
 
-                if (
-                    next_opt is not None
-                    and next_opt
-                    and len(next_opt) > 1
-                    and next_opt[0] == ","
-                ):
-                    next_opt = next_opt[1:]
-                    _LOGGER.debug(
-                        "("
-                        + self.get_attr(CONF_NAME)
-                        + ") [adv_options] Next Options: "
-                        + str(next_opt)
-                    )
-                    if next_opt is not None and next_opt:
-                        self.build_from_advanced_options(next_opt.strip())
-                        # _LOGGER.debug(
-                        #    "("
-                        #    + self.get_attr(CONF_NAME)
-                        #    + ") [adv_options] Back from recursion"
-                        # )
-                return
-            return
-        elif "," in curr_options:
-            # _LOGGER.debug(
-            #    "("
-            #    + self.get_attr(CONF_NAME)
-            #    + ") [adv_options] Options has , but no [ or (, splitting"
-            # )
-            for opt in curr_options.split(","):
-                if opt is not None and opt:
-                    ret_state = self.get_option_state(opt.strip())
-                    if ret_state is not None and ret_state:
-                        self.adv_options_state_list.append(ret_state)
-                        _LOGGER.debug(
-                            "("
-                            + self.get_attr(CONF_NAME)
-                            + ") [adv_options] Updated state list: "
-                            + str(self.adv_options_state_list)
-                        )
-            return
-        else:
-            # _LOGGER.debug(
-            #    "("
-            #    + self.get_attr(CONF_NAME)
-            #    + ") [adv_options] Options should just be a single term"
-            # )
-            ret_state = self.get_option_state(curr_options.strip())
-            if ret_state is not None and ret_state:
-                self.adv_options_state_list.append(ret_state)
-                _LOGGER.debug(
-                    "("
-                    + self.get_attr(CONF_NAME)
-                    + ") [adv_options] Updated state list: "
-                    + str(self.adv_options_state_list)
-                )
-            return
-        return
+    def _adv_comma_first(self, curr_options, symbol_num, parsed):
+        name = self.get_attr(CONF_NAME)
+        # _LOGGER.debug(
+        #    "(" + self.get_attr(CONF_NAME) + ") [adv_options] Comma is First"
+        # )
+        opt = curr_options[:symbol_num]
+        _LOGGER.debug("(%s) [adv_options] Option: %s", name, opt)
+        if opt:
+            parsed.append((opt.strip(), None, None, None, None, None))
+        next_opt = curr_options[(symbol_num + 1):]
+        _LOGGER.debug("(%s) [adv_options] Next Options: %s", name, next_opt)
+        return next_opt
+
+    def _adv_bracket_first(self, curr_options, symbol_num, parsed):
+        # _LOGGER.debug(
+        #    "(" + self.get_attr(CONF_NAME) + ") [adv_options] Bracket is First"
+        # )
+        opt = curr_options[:symbol_num]
+        _LOGGER.debug("(%s) [adv_options] Option: %s", self.get_attr(CONF_NAME), opt)
+        incl = excl = incl_attr = excl_attr = None
+        none_opt, next_opt = self.parse_bracket(curr_options[symbol_num:])
+        if next_opt and len(next_opt) > 1 and next_opt[0] == "(":
+            # Parse Parenthesis
+            incl, excl, incl_attr, excl_attr, next_opt = self.parse_parens(next_opt)
+        return self._adv_add_option(
+            parsed, opt, none_opt, next_opt, incl, excl, incl_attr, excl_attr
+        )
+
+    def _adv_paren_first(self, curr_options, symbol_num, parsed):
+        # _LOGGER.debug(
+        #    "("
+        #    + self.get_attr(CONF_NAME)
+        #    + ") [adv_options] Parenthesis is First"
+        # )
+        opt = curr_options[:symbol_num]
+        _LOGGER.debug("(%s) [adv_options] Option: %s", self.get_attr(CONF_NAME), opt)
+        none_opt = None
+        incl, excl, incl_attr, excl_attr, next_opt = self.parse_parens(
+            curr_options[symbol_num:]
+        )
+        if next_opt and len(next_opt) > 1 and next_opt[0] == "[":
+            # Parse Bracket
+            none_opt, next_opt = self.parse_bracket(next_opt)
+        return self._adv_add_option(
+            parsed, opt, none_opt, next_opt, incl, excl, incl_attr, excl_attr
+        )
+
+    def _adv_add_option(
+        self, parsed, opt, none_opt, next_opt, incl, excl, incl_attr, excl_attr
+    ):
+        """Add opt with its filters and none_opt fallback, and return the rest."""
+        name = self.get_attr(CONF_NAME)
+        if opt:
+            fallback = None
+            if none_opt:
+                fallback = self._parse_advanced_options(none_opt.strip())
+            parsed.append((opt.strip(), incl, excl, incl_attr, excl_attr, fallback))
+
+        if next_opt and len(next_opt) > 1 and next_opt[0] == ",":
+            next_opt = next_opt[1:]
+            _LOGGER.debug("(%s) [adv_options] Next Options: %s", name, next_opt)
+            return next_opt
+        return None
+
+    _ADV_FIRST_SYMBOL_HANDLERS = {
+        ",": _adv_comma_first,
+        "[": _adv_bracket_first,
+        "(": _adv_paren_first,
+    }
 
     def parse_parens(self, curr_options):
+        name = self.get_attr(CONF_NAME)
         incl = []
         excl = []
-        incl_attr = {}
-        excl_attr = {}
+        incl_attr = []
+        excl_attr = []
         incl_excl_list = []
         empty_paren = False
         next_opt = None
         paren_count = 1
         close_paren_num = 0
         last_comma = -1
+        # Positions of the first ( and ) inside the current item, and whether
+        # it has any more of either
+        item_lparen = -1
+        item_rparen = -1
+        item_extra_paren = False
         if curr_options[0] == "(":
             curr_options = curr_options[1:]
         if curr_options[0] == ")":
             empty_paren = True
             close_paren_num = 0
         else:
-            for i, c in enumerate(curr_options):
-                if c in [",", ")"] and paren_count == 1:
-                    incl_excl_list.append(curr_options[(last_comma + 1): i].strip())
+            # Only commas and parentheses change the state
+            for match in _PAREN_SCAN_RE.finditer(curr_options):
+                i = match.start()
+                c = match.group()
+                if c != "(" and paren_count == 1:
+                    incl_excl_list.append(
+                        (
+                            curr_options[(last_comma + 1): i].strip(),
+                            last_comma + 1,
+                            item_lparen,
+                            item_rparen,
+                            item_extra_paren,
+                        )
+                    )
                     last_comma = i
+                    item_lparen = -1
+                    item_rparen = -1
+                    item_extra_paren = False
                 if c == "(":
                     paren_count += 1
+                    if item_lparen == -1:
+                        item_lparen = i
+                    else:
+                        item_extra_paren = True
                 elif c == ")":
                     paren_count -= 1
+                    # The ) closing this group ends the item instead
+                    if paren_count > 0:
+                        if item_rparen == -1:
+                            item_rparen = i
+                        else:
+                            item_extra_paren = True
                 if paren_count == 0:
                     close_paren_num = i
                     break
@@ -1855,7 +1796,7 @@ class Places(SensorEntity):
             # )
             paren_first = True
             paren_incl = True
-            for item in incl_excl_list:
+            for item, item_start, lparen, rparen, extra_paren in incl_excl_list:
                 if paren_first:
                     paren_first = False
                     if item == "-":
@@ -1876,27 +1817,25 @@ class Places(SensorEntity):
                 #    + ") [parse_parens] item: "
                 #    + str(item)
                 # )
-                if item is not None and item:
-                    if "(" in item:
-                        if (
-                            ")" not in item
-                            or item.count("(") > 1
-                            or item.count(")") > 1
-                        ):
+                if item:
+                    if lparen != -1:
+                        if rparen == -1 or extra_paren:
                             _LOGGER.error(
-                                "("
-                                + self.get_attr(CONF_NAME)
-                                + ") [parse_parens] Parenthesis Mismatch: "
-                                + str(item)
+                                "(%s) [parse_parens] Parenthesis Mismatch: %s",
+                                name,
+                                item,
                             )
                             continue
-                        paren_attr = item[: item.find("(")]
+                        # (attribute, states) pairs, so aliases of one attribute
+                        # each keep their filter. An unknown name maps to None,
+                        # which never has a state
+                        paren_attr = DISPLAY_OPTIONS_MAP.get(
+                            curr_options[item_start:lparen].strip().lower()
+                        )
                         paren_attr_first = True
                         paren_attr_incl = True
                         paren_attr_list = []
-                        for attr_item in item[
-                            (item.find("(") + 1): item.find(")")
-                        ].split(","):
+                        for attr_item in curr_options[(lparen + 1): rparen].split(","):
 
                             if paren_attr_first:
                                 paren_attr_first = False
@@ -1926,9 +1865,9 @@ class Places(SensorEntity):
                             # )
                             paren_attr_list.append(attr_item.strip())
                         if paren_attr_incl:
-                            incl_attr.update({paren_attr: paren_attr_list})
+                            incl_attr.append((paren_attr, paren_attr_list))
                         else:
-                            excl_attr.update({paren_attr: paren_attr_list})
+                            excl_attr.append((paren_attr, paren_attr_list))
                     elif paren_incl:
                         incl.append(item)
                     else:
@@ -1936,27 +1875,15 @@ class Places(SensorEntity):
 
         elif not empty_paren:
             _LOGGER.error(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") [parse_parens] Parenthesis Mismatch: "
-                + str(curr_options)
+                "(%s) [parse_parens] Parenthesis Mismatch: %s", name, curr_options
             )
         next_opt = curr_options[(close_paren_num + 1):]
-        _LOGGER.debug(
-            "("
-            + self.get_attr(CONF_NAME)
-            + ") [parse_parens] Raw Next Options: "
-            + str(next_opt)
-        )
+        _LOGGER.debug("(%s) [parse_parens] Raw Next Options: %s", name, next_opt)
         return incl, excl, incl_attr, excl_attr, next_opt
 
     def parse_bracket(self, curr_options):
-        _LOGGER.debug(
-            "("
-            + self.get_attr(CONF_NAME)
-            + ") [parse_bracket] Options: "
-            + str(curr_options)
-        )
+        name = self.get_attr(CONF_NAME)
+        _LOGGER.debug("(%s) [parse_bracket] Options: %s", name, curr_options)
         empty_bracket = False
         none_opt = None
         next_opt = None
@@ -1969,49 +1896,54 @@ class Places(SensorEntity):
             close_bracket_num = 0
             bracket_count = 0
         else:
-            for i, c in enumerate(curr_options):
-                if c == "[":
-                    bracket_count += 1
-                elif c == "]":
-                    bracket_count -= 1
-                if bracket_count == 0:
-                    close_bracket_num = i
-                    break
+            close_num = curr_options.find("]")
+            inner_open_num = curr_options.find("[")
+            if close_num != -1 and (inner_open_num == -1 or close_num < inner_open_num):
+                # Not nested, the first ] closes it
+                close_bracket_num = close_num
+                bracket_count = 0
+            elif inner_open_num != -1:
+                for i, c in enumerate(curr_options):
+                    if c == "[":
+                        bracket_count += 1
+                    elif c == "]":
+                        bracket_count -= 1
+                    if bracket_count == 0:
+                        close_bracket_num = i
+                        break
 
         if empty_bracket or (close_bracket_num > 0 and bracket_count == 0):
             none_opt = curr_options[:close_bracket_num].strip()
-            _LOGGER.debug(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") [parse_bracket] None Options: "
-                + str(none_opt)
-            )
+            _LOGGER.debug("(%s) [parse_bracket] None Options: %s", name, none_opt)
             next_opt = curr_options[(close_bracket_num + 1):].strip()
-            _LOGGER.debug(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") [parse_bracket] Raw Next Options: "
-                + str(next_opt)
-            )
+            _LOGGER.debug("(%s) [parse_bracket] Raw Next Options: %s", name, next_opt)
         else:
             _LOGGER.error(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") [parse_bracket] Bracket Mismatch Error: "
-                + str(curr_options)
+                "(%s) [parse_bracket] Bracket Mismatch Error: %s", name, curr_options
             )
         return none_opt, next_opt
 
-    def get_option_state(self, opt, incl=[], excl=[], incl_attr={}, excl_attr={}):
-        if opt is not None and opt:
-            opt = opt.lower().strip()
-        _LOGGER.debug(
-            "(" + self.get_attr(CONF_NAME) + ") [get_option_state] Option: " + str(opt)
-        )
-        out = self.get_attr(DISPLAY_OPTIONS_MAP.get(opt))
-        _LOGGER.debug(
-            "(" + self.get_attr(CONF_NAME) + ") [get_option_state] State: " + str(out)
-        )
+    def get_option_state(
+        self, opt, incl=None, excl=None, incl_attr=None, excl_attr=None
+    ):
+        name = self.get_attr(CONF_NAME)
+        norm = _NORMALIZED_OPT_CACHE.get(opt)
+        if norm is None:
+            norm = opt.lower().strip() if opt else opt
+            if (
+                norm in DISPLAY_OPTIONS_MAP
+                and len(_NORMALIZED_OPT_CACHE) < NORMALIZED_OPT_CACHE_MAX_ENTRIES
+            ):
+                _NORMALIZED_OPT_CACHE[opt] = norm
+        opt = norm
+        _LOGGER.debug("(%s) [get_option_state] Option: %s", name, opt)
+        if opt not in _KNOWN_OPTS:
+            return None
+        attr_key = DISPLAY_OPTIONS_MAP[opt]
+        out = self.get_attr(attr_key)
+        _LOGGER.debug("(%s) [get_option_state] State: %s", name, out)
+        if not out:
+            return None
         # _LOGGER.debug(
         #    "("
         #    + self.get_attr(CONF_NAME)
@@ -2036,68 +1968,55 @@ class Places(SensorEntity):
         #    + ") [get_option_state] excl_attr dict: "
         #    + str(excl_attr)
         # )
-        if out is not None and out:
-            if incl and out not in incl:
-                out = None
-            elif excl and out in excl:
-                out = None
-            if incl_attr:
-                for attr, states in incl_attr.items():
-                    # _LOGGER.debug(
-                    #    "("
-                    #    + self.get_attr(CONF_NAME)
-                    #    + ") [get_option_state] incl_attr: "
-                    #    + str(attr)
-                    #    + " / State: "
-                    #    + str(self.get_attr(DISPLAY_OPTIONS_MAP.get(attr)))
-                    # )
-                    # _LOGGER.debug(
-                    #    "("
-                    #    + self.get_attr(CONF_NAME)
-                    #    + ") [get_option_state] incl_states: "
-                    #    + str(states)
-                    # )
-                    if (
-                        self.is_attr_blank(DISPLAY_OPTIONS_MAP.get(attr))
-                        or self.get_attr(DISPLAY_OPTIONS_MAP.get(attr)) not in states
-                    ):
-                        out = None
-            if excl_attr:
-                for attr, states in excl_attr.items():
-                    # _LOGGER.debug(
-                    #    "("
-                    #    + self.get_attr(CONF_NAME)
-                    #    + ") [get_option_state] excl_attr: "
-                    #    + str(attr)
-                    #    + " / State: "
-                    #    + str(self.get_attr(DISPLAY_OPTIONS_MAP.get(attr)))
-                    # )
-                    # _LOGGER.debug(
-                    #    "("
-                    #    + self.get_attr(CONF_NAME)
-                    #    + ") [get_option_state] excl_states: "
-                    #    + str(states)
-                    # )
-                    if self.get_attr(DISPLAY_OPTIONS_MAP.get(attr)) in states:
-                        out = None
-            _LOGGER.debug(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") [get_option_state] State after incl/excl: "
-                + str(out)
-            )
-        if out is not None and out:
-            if out == out.lower() and (
-                DISPLAY_OPTIONS_MAP.get(opt) == ATTR_DEVICETRACKER_ZONE_NAME
-                or DISPLAY_OPTIONS_MAP.get(opt) == ATTR_PLACE_TYPE
-                or DISPLAY_OPTIONS_MAP.get(opt) == ATTR_PLACE_CATEGORY
-            ):
+        if incl and out not in incl:
+            out = None
+        elif excl and out in excl:
+            out = None
+        if incl_attr:
+            for attr, states in incl_attr:
+                # _LOGGER.debug(
+                #    "("
+                #    + self.get_attr(CONF_NAME)
+                #    + ") [get_option_state] incl_attr: "
+                #    + str(attr)
+                #    + " / State: "
+                #    + str(self.get_attr(DISPLAY_OPTIONS_MAP.get(attr)))
+                # )
+                # _LOGGER.debug(
+                #    "("
+                #    + self.get_attr(CONF_NAME)
+                #    + ") [get_option_state] incl_states: "
+                #    + str(states)
+                # )
+                # get_attr returns None for a blank attribute
+                cur_val = self.get_attr(attr)
+                if cur_val is None or cur_val not in states:
+                    out = None
+        if excl_attr:
+            for attr, states in excl_attr:
+                # _LOGGER.debug(
+                #    "("
+                #    + self.get_attr(CONF_NAME)
+                #    + ") [get_option_state] excl_attr: "
+                #    + str(attr)
+                #    + " / State: "
+                #    + str(self.get_attr(DISPLAY_OPTIONS_MAP.get(attr)))
+                # )
+                # _LOGGER.debug(
+                #    "("
+                #    + self.get_attr(CONF_NAME)
+                #    + ") [get_option_state] excl_states: "
+                #    + str(states)
+                # )
+                cur_val = self.get_attr(attr)
+                if cur_val in states:
+                    out = None
+        _LOGGER.debug("(%s) [get_option_state] State after incl/excl: %s", name, out)
+        if out:
+            if attr_key in _TITLECASE_ATTRS and out == out.lower():
                 out = out.title()
             out = out.strip()
-            if (
-                DISPLAY_OPTIONS_MAP.get(opt) == ATTR_STREET
-                or DISPLAY_OPTIONS_MAP.get(opt) == ATTR_STREET_REF
-            ):
+            if attr_key in _STREET_ATTRS:
                 self.street_i = self.temp_i
                 # _LOGGER.debug(
                 #    "("
@@ -2105,7 +2024,7 @@ class Places(SensorEntity):
                 #    + ") [get_option_state] street_i: "
                 #    + str(self.street_i)
                 # )
-            if DISPLAY_OPTIONS_MAP.get(opt) == ATTR_STREET_NUMBER:
+            if attr_key == ATTR_STREET_NUMBER:
                 self.street_num_i = self.temp_i
                 # _LOGGER.debug(
                 #    "("
@@ -2119,179 +2038,148 @@ class Places(SensorEntity):
             return None
 
     def compile_state_from_advanced_options(self):
+        name = self.get_attr(CONF_NAME)
         self.street_num_i += 1
-        first = True
+        parts = []
         for i, out in enumerate(self.adv_options_state_list):
-            if out is not None and out:
-                out = out.strip()
-                if first:
-                    self.set_attr(ATTR_NATIVE_VALUE, str(out))
-                    first = False
-                else:
+            if out:
+                if parts:
                     if i == self.street_i and i == self.street_num_i:
-                        self.set_attr(
-                            ATTR_NATIVE_VALUE, self.get_attr(ATTR_NATIVE_VALUE) + " "
-                        )
+                        parts.append(" ")
                     else:
-                        self.set_attr(
-                            ATTR_NATIVE_VALUE, self.get_attr(ATTR_NATIVE_VALUE) + ", "
-                        )
-                    self.set_attr(
-                        ATTR_NATIVE_VALUE, self.get_attr(ATTR_NATIVE_VALUE) + str(out)
-                    )
+                        parts.append(", ")
+                parts.append(str(out.strip()))
+        if parts:
+            self.set_attr(ATTR_NATIVE_VALUE, "".join(parts))
 
         _LOGGER.debug(
-            "("
-            + self.get_attr(CONF_NAME)
-            + ") New State from Advanced Display Options: "
-            + str(self.get_attr(ATTR_NATIVE_VALUE))
+            "(%s) New State from Advanced Display Options: %s",
+            name,
+            self.get_attr(ATTR_NATIVE_VALUE),
         )
 
     def build_state_from_display_options(self):
         # Options:  "formatted_place, driving, zone, zone_name, place_name, place, street_number, street, city, county, state, postal_code, country, formatted_address, do_not_show_not_home"
 
+        name = self.get_attr(CONF_NAME)
         display_options = self.get_attr(ATTR_DISPLAY_OPTIONS_LIST)
+        opts_set = frozenset(display_options or ())
+        show_zone = "do_not_show_not_home" not in opts_set
         _LOGGER.debug(
-            "("
-            + self.get_attr(CONF_NAME)
-            + ") Building State from Display Options: "
-            + str(self.get_attr(ATTR_DISPLAY_OPTIONS))
+            "(%s) Building State from Display Options: %s",
+            name,
+            self.get_attr(ATTR_DISPLAY_OPTIONS),
         )
 
         user_display = []
-        if "driving" in display_options and not self.is_attr_blank(ATTR_DRIVING):
-            user_display.append(self.get_attr(ATTR_DRIVING))
 
-        if (
-            "zone_name" in display_options
-            and "do_not_show_not_home" not in display_options
-            and not self.is_attr_blank(ATTR_DEVICETRACKER_ZONE_NAME)
-        ):
-            user_display.append(self.get_attr(ATTR_DEVICETRACKER_ZONE_NAME))
-        elif (
-            "zone" in display_options
-            and "do_not_show_not_home" not in display_options
-            and not self.is_attr_blank(ATTR_DEVICETRACKER_ZONE)
-        ):
-            user_display.append(self.get_attr(ATTR_DEVICETRACKER_ZONE))
-
-        if "place_name" in display_options and not self.is_attr_blank(ATTR_PLACE_NAME):
-            user_display.append(self.get_attr(ATTR_PLACE_NAME))
-        if "place" in display_options:
-            if not self.is_attr_blank(ATTR_PLACE_NAME) and self.get_attr(
-                ATTR_PLACE_NAME
-            ) != self.get_attr(ATTR_STREET):
-                user_display.append(self.get_attr(ATTR_PLACE_NAME))
-            if (
-                not self.is_attr_blank(ATTR_PLACE_CATEGORY)
-                and self.get_attr(ATTR_PLACE_CATEGORY).lower() != "place"
-            ):
-                user_display.append(self.get_attr(ATTR_PLACE_CATEGORY))
-            if (
-                not self.is_attr_blank(ATTR_PLACE_TYPE)
-                and self.get_attr(ATTR_PLACE_TYPE).lower() != "yes"
-            ):
-                user_display.append(self.get_attr(ATTR_PLACE_TYPE))
-            if not self.is_attr_blank(ATTR_PLACE_NEIGHBOURHOOD):
-                user_display.append(self.get_attr(ATTR_PLACE_NEIGHBOURHOOD))
-            if not self.is_attr_blank(ATTR_STREET_NUMBER):
-                user_display.append(self.get_attr(ATTR_STREET_NUMBER))
-            if not self.is_attr_blank(ATTR_STREET):
-                user_display.append(self.get_attr(ATTR_STREET))
-        else:
-            if "street_number" in display_options and not self.is_attr_blank(
-                ATTR_STREET_NUMBER
-            ):
-                user_display.append(self.get_attr(ATTR_STREET_NUMBER))
-            if "street" in display_options and not self.is_attr_blank(ATTR_STREET):
-                user_display.append(self.get_attr(ATTR_STREET))
-        if "city" in display_options and not self.is_attr_blank(ATTR_CITY):
-            user_display.append(self.get_attr(ATTR_CITY))
-        if "county" in display_options and not self.is_attr_blank(ATTR_COUNTY):
-            user_display.append(self.get_attr(ATTR_COUNTY))
-        if "state" in display_options and not self.is_attr_blank(ATTR_REGION):
-            user_display.append(self.get_attr(ATTR_REGION))
-        elif "region" in display_options and not self.is_attr_blank(ATTR_REGION):
-            user_display.append(self.get_attr(ATTR_REGION))
-        if "postal_code" in display_options and not self.is_attr_blank(
-            ATTR_POSTAL_CODE
-        ):
-            user_display.append(self.get_attr(ATTR_POSTAL_CODE))
-        if "country" in display_options and not self.is_attr_blank(ATTR_COUNTRY):
-            user_display.append(self.get_attr(ATTR_COUNTRY))
-        if "formatted_address" in display_options and not self.is_attr_blank(
-            ATTR_FORMATTED_ADDRESS
-        ):
-            user_display.append(self.get_attr(ATTR_FORMATTED_ADDRESS))
+        def pick(option, attr):
+            if option in opts_set:
+                # get_attr returns None for a blank attribute
+                value = self.get_attr(attr)
+                if value is not None:
+                    user_display.append(value)
+
+        pick("driving", ATTR_DRIVING)
 
-        if "do_not_reorder" in display_options:
+        if show_zone:
+            zone_name = self.get_attr(ATTR_DEVICETRACKER_ZONE_NAME)
+            if "zone_name" in opts_set and zone_name is not None:
+                user_display.append(zone_name)
+            else:
+                pick("zone", ATTR_DEVICETRACKER_ZONE)
+
+        def append_place():
+            place_name = self.get_attr(ATTR_PLACE_NAME)
+            if place_name is not None and place_name != self.get_attr(ATTR_STREET):
+                user_display.append(place_name)
+            category = self.get_attr(ATTR_PLACE_CATEGORY)
+            if category is not None and category.lower() != "place":
+                user_display.append(category)
+            place_type = self.get_attr(ATTR_PLACE_TYPE)
+            if place_type is not None and place_type.lower() != "yes":
+                user_display.append(place_type)
+            for attr in (ATTR_PLACE_NEIGHBOURHOOD, ATTR_STREET_NUMBER, ATTR_STREET):
+                value = self.get_attr(attr)
+                if value is not None:
+                    user_display.append(value)
+
+        pick("place_name", ATTR_PLACE_NAME)
+        if "place" in opts_set:
+            append_place()
+        else:
+            pick("street_number", ATTR_STREET_NUMBER)
+            pick("street", ATTR_STREET)
+        pick("city", ATTR_CITY)
+        pick("county", ATTR_COUNTY)
+        if "state" in opts_set:
+            pick("state", ATTR_REGION)
+        else:
+            pick("region", ATTR_REGION)
+        pick("postal_code", ATTR_POSTAL_CODE)
+        pick("country", ATTR_COUNTRY)
+        pick("formatted_address", ATTR_FORMATTED_ADDRESS)
+
+        if "do_not_reorder" in opts_set:
+            # Values in the order the options were given, options without an
+            # attribute (like do_not_reorder itself) are skipped
             user_display = []
-            display_options.remove("do_not_reorder")
             for option in display_options:
-                if option == "state":
-                    target_option = "region"
-                if option == "place_neighborhood":
-                    target_option = "place_neighbourhood"
-                if option in locals():
-                    user_display.append(target_option)
+                if option == "place":
+                    append_place()
+                    continue
+                if option in _ZONE_OPTIONS and not show_zone:
+                    continue
+                value = self.get_attr(_DISPLAY_OPTION_RENAMES.get(option))
+                if value is not None:
+                    user_display.append(value)
 
         if user_display:
             self.set_attr(ATTR_NATIVE_VALUE, ", ".join(item for item in user_display))
         _LOGGER.debug(
-            "("
-            + self.get_attr(CONF_NAME)
-            + ") New State from Display Options: "
-            + str(self.get_attr(ATTR_NATIVE_VALUE))
+            "(%s) New State from Display Options: %s",
+            name,
+            self.get_attr(ATTR_NATIVE_VALUE),
         )
 
-    def get_extended_attr(self):
-        if not self.is_attr_blank(ATTR_OSM_ID) and not self.is_attr_blank(
-            ATTR_OSM_TYPE
-        ):
-            if self.get_attr(ATTR_OSM_TYPE).lower() == "node":
-                osm_type_abbr = "N"
-            elif self.get_attr(ATTR_OSM_TYPE).lower() == "way":
-                osm_type_abbr = "W"
-            elif self.get_attr(ATTR_OSM_TYPE).lower() == "relation":
-                osm_type_abbr = "R"
-
+    async def get_extended_attr(self):
+        osm_type_abbr = _OSM_TYPE_ABBR.get((self.get_attr(ATTR_OSM_TYPE) or "").lower())
+        if not self.is_attr_blank(ATTR_OSM_ID) and osm_type_abbr is not None:
+            params = {
+                "osmtype": osm_type_abbr,
+                "osmid": self.get_attr(ATTR_OSM_ID),
+                "linkedplaces": 1,
+                "hierarchy": 1,
+                "group_hierarchy": 1,
+                "limit": 1,
+                "format": "json",
+            }
+            if not self.is_attr_blank(CONF_API_KEY):
+                params["email"] = self.get_attr(CONF_API_KEY)
+            if not self.is_attr_blank(CONF_LANGUAGE):
+                params["accept-language"] = self.get_attr(CONF_LANGUAGE)
             osm_details_url = (
-                "https://nominatim.openstreetmap.org/details.php?osmtype="
-                + str(osm_type_abbr)
-                + "&osmid="
-                + str(self.get_attr(ATTR_OSM_ID))
-                + "&linkedplaces=1&hierarchy=1&group_hierarchy=1&limit=1&format=json"
-                + (
-                    "&email=" + str(self.get_attr(CONF_API_KEY))
-                    if self.is_attr_blank(CONF_API_KEY)
-                    else ""
-                )
-                + (
-                    "&accept-language=" + str(self.get_attr(CONF_LANGUAGE))
-                    if not self.is_attr_blank(CONF_LANGUAGE)
-                    else ""
-                )
+                "https://nominatim.openstreetmap.org/details.php?"
+                + urllib.parse.urlencode(params)
             )
-            self.set_attr(
-                ATTR_OSM_DETAILS_DICT,
-                self.get_dict_from_url(osm_details_url, "OpenStreetMaps Details"),
+            osm_details_dict = await self.get_cached_dict_from_url(
+                (
+                    "details",
+                    osm_type_abbr,
+                    self.get_attr(ATTR_OSM_ID),
+                    self.get_attr(CONF_LANGUAGE),
+                ),
+                osm_details_url,
+                "OpenStreetMaps Details",
             )
+            self.set_attr(ATTR_OSM_DETAILS_DICT, osm_details_dict)
 
-            if not self.is_attr_blank(ATTR_OSM_DETAILS_DICT):
+            if osm_details_dict:
                 # _LOGGER.debug("(" + self.get_attr(CONF_NAME) + ") OSM Details Dict: " + str(osm_details_dict))
 
-                if (
-                    not self.is_attr_blank(ATTR_OSM_DETAILS_DICT)
-                    and "extratags" in self.get_attr(ATTR_OSM_DETAILS_DICT)
-                    and "wikidata"
-                    in self.get_attr(ATTR_OSM_DETAILS_DICT).get("extratags")
-                ):
-                    self.set_attr(
-                        ATTR_WIKIDATA_ID,
-                        self.get_attr(ATTR_OSM_DETAILS_DICT)
-                        .get("extratags")
-                        .get("wikidata"),
-                    )
+                extratags = osm_details_dict.get("extratags")
+                if extratags and "wikidata" in extratags:
+                    self.set_attr(ATTR_WIKIDATA_ID, extratags.get("wikidata"))
 
                 self.set_attr(ATTR_WIKIDATA_DICT, {})
                 if not self.is_attr_blank(ATTR_WIKIDATA_ID):
@@ -2302,64 +2190,45 @@ class Places(SensorEntity):
                     )
                     self.set_attr(
                         ATTR_WIKIDATA_DICT,
-                        self.get_dict_from_url(wikidata_url, "Wikidata"),
+                        await self.get_dict_from_url(wikidata_url, "Wikidata"),
                     )
 
     def fire_event_data(self, prev_last_place_name):
-        _LOGGER.debug("(" + self.get_attr(CONF_NAME) + ") Building Event Data")
-        event_data = {}
-        if not self.is_attr_blank(CONF_NAME):
-            event_data.update({"entity": self.get_attr(CONF_NAME)})
-        if not self.is_attr_blank(ATTR_PREVIOUS_STATE):
-            event_data.update({"from_state": self.get_attr(ATTR_PREVIOUS_STATE)})
-        if not self.is_attr_blank(ATTR_NATIVE_VALUE):
-            event_data.update({"to_state": self.get_attr(ATTR_NATIVE_VALUE)})
-
-        for attr in EVENT_ATTRIBUTE_LIST:
-            if not self.is_attr_blank(attr):
-                event_data.update({attr: self.get_attr(attr)})
-
-        if (
-            not self.is_attr_blank(ATTR_LAST_PLACE_NAME)
-            and self.get_attr(ATTR_LAST_PLACE_NAME) != prev_last_place_name
-        ):
-            event_data.update(
-                {ATTR_LAST_PLACE_NAME: self.get_attr(ATTR_LAST_PLACE_NAME)}
-            )
-
-        if self.get_attr(CONF_EXTENDED_ATTR):
-            for attr in EXTENDED_ATTRIBUTE_LIST:
-                if not self.is_attr_blank(attr):
-                    event_data.update({attr: self.get_attr(attr)})
+        name = self.get_attr(CONF_NAME)
+        _LOGGER.debug("(%s) Building Event Data", name)
+        # Read the attribute store directly, blank values are left out like
+        # is_attr_blank would
+        get = self._internal_attr.get
+        event_attrs = EVENT_ATTRIBUTE_LIST
+        if get(CONF_EXTENDED_ATTR):
+            event_attrs = _EXTENDED_EVENT_ATTRIBUTES
+        event_data = {
+            attr: value for attr in event_attrs if (value := get(attr)) or value == 0
+        }
+        if name is not None:
+            event_data["entity"] = name
+        value = get(ATTR_PREVIOUS_STATE)
+        if value or value == 0:
+            event_data["from_state"] = value
+        value = get(ATTR_NATIVE_VALUE)
+        if value or value == 0:
+            event_data["to_state"] = value
+        value = get(ATTR_LAST_PLACE_NAME)
+        if (value or value == 0) and value != prev_last_place_name:
+            event_data[ATTR_LAST_PLACE_NAME] = value
 
         self._hass.bus.fire(DOMAIN + "_state_update", event_data)
         _LOGGER.debug(
-            "("
-            + self.get_attr(CONF_NAME)
-            + ") Event Details [event_type: "
-            + DOMAIN
-            + "_state_update]: "
-            + str(event_data)
-        )
-        _LOGGER.info(
-            "("
-            + self.get_attr(CONF_NAME)
-            + ") Event Fired [event_type: "
-            + DOMAIN
-            + "_state_update]"
+            "(%s) Event Details [event_type: %s_state_update]: %s",
+            name,
+            DOMAIN,
+            event_data,
         )
+        _LOGGER.info("(%s) Event Fired [event_type: %s_state_update]", name, DOMAIN)
 
-    def write_sensor_to_json(self):
-        sensor_attributes = copy.deepcopy(self._internal_attr)
-        for k, v in list(sensor_attributes.items()):
-            if isinstance(v, (datetime)):
-                # _LOGGER.debug(
-                #    "("
-                #    + self.get_attr(CONF_NAME)
-                #    + ") Removing Sensor Attribute: "
-                #    + str(k)
-                # )
-                sensor_attributes.pop(k)
+    def write_sensor_to_json(self, sensor_attributes):
+        """Write the attributes to the JSON file, return whether it worked."""
+        name = self.get_attr(CONF_NAME)
         # _LOGGER.debug(
         #    "("
         #    + self.get_attr(CONF_NAME)
@@ -2369,40 +2238,49 @@ class Places(SensorEntity):
         try:
             with open(
                 os.path.join(PLACES_JSON_FOLDER, self.get_attr(ATTR_JSON_FILENAME)),
-                "w",
+                "wb",
             ) as jsonfile:
-                json.dump(sensor_attributes, jsonfile)
+                jsonfile.write(_json_dumps(sensor_attributes))
         except OSError as e:
             _LOGGER.debug(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") OSError writing sensor to JSON ("
-                + str(self.get_attr(ATTR_JSON_FILENAME))
-                + "): "
-                + str(e)
+                "(%s) OSError writing sensor to JSON (%s): %s",
+                name,
+                self.get_attr(ATTR_JSON_FILENAME),
+                e,
             )
         except Exception as e:
             _LOGGER.debug(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") Unknown Exception writing sensor to JSON ("
-                + str(self.get_attr(ATTR_JSON_FILENAME))
-                + "): "
-                + str(e)
+                "(%s) Unknown Exception writing sensor to JSON (%s): %s",
+                name,
+                self.get_attr(ATTR_JSON_FILENAME),
+                e,
             )
+        else:
+            return True
+        return False
+
+    async def async_write_sensor_to_json(self):
+        """Save the attributes to the JSON file off the event loop."""
+        # datetimes aren't saved, the rest is only read by the encoder
+        sensor_attributes = {
+            k: v for k, v in self._internal_attr.items() if not isinstance(v, datetime)
+        }
+        if sensor_attributes == self._saved_attributes:
+            return
+        if await self._hass.async_add_executor_job(
+            self.write_sensor_to_json, sensor_attributes
+        ):
+            self._saved_attributes = sensor_attributes
 
     def get_initial_last_place_name(self):
+        name = self.get_attr(CONF_NAME)
         _LOGGER.debug(
-            "("
-            + self.get_attr(CONF_NAME)
-            + ") Previous State: "
-            + str(self.get_attr(ATTR_PREVIOUS_STATE))
+            "(%s) Previous State: %s", name, self.get_attr(ATTR_PREVIOUS_STATE)
         )
         _LOGGER.debug(
-            "("
-            + self.get_attr(CONF_NAME)
-            + ") Previous last_place_name: "
-            + str(self.get_attr(ATTR_LAST_PLACE_NAME))
+            "(%s) Previous last_place_name: %s",
+            name,
+            self.get_attr(ATTR_LAST_PLACE_NAME),
         )
 
         if not self.in_zone():
@@ -2411,202 +2289,147 @@ class Places(SensorEntity):
                 # If place name is set
                 self.set_attr(ATTR_LAST_PLACE_NAME, self.get_attr(ATTR_PLACE_NAME))
                 _LOGGER.debug(
-                    "("
-                    + self.get_attr(CONF_NAME)
-                    + ") Previous place is Place Name, last_place_name is set: "
-                    + str(self.get_attr(ATTR_LAST_PLACE_NAME))
+                    "(%s) Previous place is Place Name, last_place_name is set: %s",
+                    name,
+                    self.get_attr(ATTR_LAST_PLACE_NAME),
                 )
             else:
                 # If blank, keep previous last_place_name
-                _LOGGER.debug(
-                    "("
-                    + self.get_attr(CONF_NAME)
-                    + ") Previous Place Name is None, keeping prior"
-                )
+                _LOGGER.debug("(%s) Previous Place Name is None, keeping prior", name)
         else:
             # Previously In a Zone
             self.set_attr(
                 ATTR_LAST_PLACE_NAME, self.get_attr(ATTR_DEVICETRACKER_ZONE_NAME)
             )
             _LOGGER.debug(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") Previous Place is Zone: "
-                + str(self.get_attr(ATTR_LAST_PLACE_NAME))
+                "(%s) Previous Place is Zone: %s",
+                name,
+                self.get_attr(ATTR_LAST_PLACE_NAME),
             )
         _LOGGER.debug(
-            "("
-            + self.get_attr(CONF_NAME)
-            + ") last_place_name (Initial): "
-            + str(self.get_attr(ATTR_LAST_PLACE_NAME))
+            "(%s) last_place_name (Initial): %s",
+            name,
+            self.get_attr(ATTR_LAST_PLACE_NAME),
         )
 
     def update_coordinates_and_distance(self):
+        attrs = self._internal_attr
+        name = self.get_attr(CONF_NAME)
         last_distance_traveled_m = self.get_attr(ATTR_DISTANCE_FROM_HOME_M)
         proceed_with_update = 1
         # 0: False. 1: True. 2: False, but set direction of travel to stationary
-
-        if not self.is_attr_blank(ATTR_LATITUDE) and not self.is_attr_blank(
-            ATTR_LONGITUDE
-        ):
-            self.set_attr(
-                ATTR_LOCATION_CURRENT,
-                (
-                    str(self.get_attr(ATTR_LATITUDE))
-                    + ","
-                    + str(self.get_attr(ATTR_LONGITUDE))
-                ),
-            )
-        if not self.is_attr_blank(ATTR_LATITUDE_OLD) and not self.is_attr_blank(
-            ATTR_LONGITUDE_OLD
-        ):
-            self.set_attr(
-                ATTR_LOCATION_PREVIOUS,
-                (
-                    str(self.get_attr(ATTR_LATITUDE_OLD))
-                    + ","
-                    + str(self.get_attr(ATTR_LONGITUDE_OLD))
-                ),
-            )
-        if not self.is_attr_blank(ATTR_HOME_LATITUDE) and not self.is_attr_blank(
-            ATTR_HOME_LONGITUDE
-        ):
-            self.set_attr(
-                ATTR_HOME_LOCATION,
-                (
-                    str(self.get_attr(ATTR_HOME_LATITUDE))
-                    + ","
-                    + str(self.get_attr(ATTR_HOME_LONGITUDE))
-                ),
-            )
-
-        if (
-            not self.is_attr_blank(ATTR_LATITUDE)
-            and not self.is_attr_blank(ATTR_LONGITUDE)
-            and not self.is_attr_blank(ATTR_HOME_LATITUDE)
-            and not self.is_attr_blank(ATTR_HOME_LONGITUDE)
-        ):
-            self.set_attr(
-                ATTR_DISTANCE_FROM_HOME_M,
-                distance(
-                    float(self.get_attr(ATTR_LATITUDE)),
-                    float(self.get_attr(ATTR_LONGITUDE)),
-                    float(self.get_attr(ATTR_HOME_LATITUDE)),
-                    float(self.get_attr(ATTR_HOME_LONGITUDE)),
-                ),
-            )
-            if not self.is_attr_blank(ATTR_DISTANCE_FROM_HOME_M):
-                self.set_attr(
-                    ATTR_DISTANCE_FROM_HOME_KM,
-                    round(self.get_attr(ATTR_DISTANCE_FROM_HOME_M) / 1000, 3),
+        latitude = self.get_attr(ATTR_LATITUDE)
+        longitude = self.get_attr(ATTR_LONGITUDE)
+        latitude_old = self.get_attr(ATTR_LATITUDE_OLD)
+        longitude_old = self.get_attr(ATTR_LONGITUDE_OLD)
+
+        # get_attr returns None for a blank attribute. The previous location is
+        # usually the last current one, so its string is reused
+        location = self._current_location
+        if latitude_old is not None and longitude_old is not None:
+            if location[0] == (latitude_old, longitude_old):
+                attrs[ATTR_LOCATION_PREVIOUS] = location[1]
+            else:
+                attrs[ATTR_LOCATION_PREVIOUS] = (
+                    str(latitude_old) + "," + str(longitude_old)
                 )
-                self.set_attr(
-                    ATTR_DISTANCE_FROM_HOME_MI,
-                    round(self.get_attr(ATTR_DISTANCE_FROM_HOME_M) / 1609, 3),
+        if latitude is not None and longitude is not None:
+            if location[0] != (latitude, longitude):
+                location = self._current_location = (
+                    (latitude, longitude),
+                    str(latitude) + "," + str(longitude),
                 )
+            attrs[ATTR_LOCATION_CURRENT] = location[1]
+        if self._home_location is not None:
+            attrs[ATTR_HOME_LOCATION] = self._home_location
 
-            if not self.is_attr_blank(ATTR_LATITUDE_OLD) and not self.is_attr_blank(
-                ATTR_LONGITUDE_OLD
-            ):
-                self.set_attr(
-                    ATTR_DISTANCE_TRAVELED_M,
-                    distance(
-                        float(self.get_attr(ATTR_LATITUDE)),
-                        float(self.get_attr(ATTR_LONGITUDE)),
-                        float(self.get_attr(ATTR_LATITUDE_OLD)),
-                        float(self.get_attr(ATTR_LONGITUDE_OLD)),
-                    ),
+        if (
+            latitude is not None
+            and longitude is not None
+            and self._home_latitude is not None
+            and self._home_longitude is not None
+        ):
+            latitude = float(latitude)
+            longitude = float(longitude)
+            distance_from_home_m = _distance_m(
+                latitude, longitude, self._home_latitude, self._home_longitude
+            )
+            attrs[ATTR_DISTANCE_FROM_HOME_M] = distance_from_home_m
+            attrs[ATTR_DISTANCE_FROM_HOME_KM] = round(distance_from_home_m / 1000, 3)
+            attrs[ATTR_DISTANCE_FROM_HOME_MI] = round(distance_from_home_m / 1609, 3)
+
+            if latitude_old is not None and longitude_old is not None:
+                distance_traveled_m = _distance_m(
+                    latitude, longitude, float(latitude_old), float(longitude_old)
                 )
-                if not self.is_attr_blank(ATTR_DISTANCE_TRAVELED_M):
-                    self.set_attr(
-                        ATTR_DISTANCE_TRAVELED_MI,
-                        round(self.get_attr(ATTR_DISTANCE_TRAVELED_M) / 1609, 3),
-                    )
+                attrs[ATTR_DISTANCE_TRAVELED_M] = distance_traveled_m
+                attrs[ATTR_DISTANCE_TRAVELED_MI] = round(distance_traveled_m / 1609, 3)
 
                 # if self.get_attr(ATTR_DISTANCE_TRAVELED_M) <= 100:  # in meters
                 #    self.set_attr(ATTR_DIRECTION_OF_TRAVEL, "stationary")
                 # elif last_distance_traveled_m > self.get_attr(ATTR_DISTANCE_FROM_HOME_M):
-                if last_distance_traveled_m > self.get_attr(ATTR_DISTANCE_FROM_HOME_M):
-                    self.set_attr(ATTR_DIRECTION_OF_TRAVEL, "towards home")
-                elif last_distance_traveled_m < self.get_attr(
-                    ATTR_DISTANCE_FROM_HOME_M
-                ):
-                    self.set_attr(ATTR_DIRECTION_OF_TRAVEL, "away from home")
+                if last_distance_traveled_m > distance_from_home_m:
+                    attrs[ATTR_DIRECTION_OF_TRAVEL] = "towards home"
+                elif last_distance_traveled_m < distance_from_home_m:
+                    attrs[ATTR_DIRECTION_OF_TRAVEL] = "away from home"
                 else:
-                    self.set_attr(ATTR_DIRECTION_OF_TRAVEL, "stationary")
+                    attrs[ATTR_DIRECTION_OF_TRAVEL] = "stationary"
             else:
-                self.set_attr(ATTR_DIRECTION_OF_TRAVEL, "stationary")
-                self.set_attr(ATTR_DISTANCE_TRAVELED_M, 0)
-                self.set_attr(ATTR_DISTANCE_TRAVELED_MI, 0)
+                attrs[ATTR_DIRECTION_OF_TRAVEL] = "stationary"
+                attrs[ATTR_DISTANCE_TRAVELED_M] = 0
+                attrs[ATTR_DISTANCE_TRAVELED_MI] = 0
 
             _LOGGER.debug(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") Previous Location: "
-                + str(self.get_attr(ATTR_LOCATION_PREVIOUS))
-            )
-            _LOGGER.debug(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") Current Location: "
-                + str(self.get_attr(ATTR_LOCATION_CURRENT))
+                "(%s) Previous Location: %s",
+                name,
+                attrs.get(ATTR_LOCATION_PREVIOUS),
             )
             _LOGGER.debug(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") Home Location: "
-                + str(self.get_attr(ATTR_HOME_LOCATION))
+                "(%s) Current Location: %s", name, attrs.get(ATTR_LOCATION_CURRENT)
             )
+            _LOGGER.debug("(%s) Home Location: %s", name, attrs.get(ATTR_HOME_LOCATION))
             _LOGGER.info(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") Distance from home ["
-                + (self.get_attr(CONF_HOME_ZONE)).split(".")[1]
-                + "]: "
-                + str(self.get_attr(ATTR_DISTANCE_FROM_HOME_KM))
-                + " km"
+                "(%s) Distance from home [%s]: %s km",
+                name,
+                self._home_zone_name,
+                attrs.get(ATTR_DISTANCE_FROM_HOME_KM),
             )
             _LOGGER.info(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") Travel Direction: "
-                + str(self.get_attr(ATTR_DIRECTION_OF_TRAVEL))
+                "(%s) Travel Direction: %s",
+                name,
+                attrs.get(ATTR_DIRECTION_OF_TRAVEL),
             )
             _LOGGER.info(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") Meters traveled since last update: "
-                + str(round(self.get_attr(ATTR_DISTANCE_TRAVELED_M), 1))
+                "(%s) Meters traveled since last update: %s",
+                name,
+                round(attrs.get(ATTR_DISTANCE_TRAVELED_M), 1),
             )
         else:
             proceed_with_update = 0
             # 0: False. 1: True. 2: False, but set direction of travel to stationary
             _LOGGER.info(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") Problem with updated lat/long, not performing update: "
-                + "old_latitude="
-                + str(self.get_attr(ATTR_LATITUDE_OLD))
-                + ", old_longitude="
-                + str(self.get_attr(ATTR_LONGITUDE_OLD))
-                + ", new_latitude="
-                + str(self.get_attr(ATTR_LATITUDE))
-                + ", new_longitude="
-                + str(self.get_attr(ATTR_LONGITUDE))
-                + ", home_latitude="
-                + str(self.get_attr(ATTR_HOME_LATITUDE))
-                + ", home_longitude="
-                + str(self.get_attr(ATTR_HOME_LONGITUDE))
-            )
+                "(%s) Problem with updated lat/long, not performing update: "
+                "old_latitude=%s, old_longitude=%s, new_latitude=%s, "
+                "new_longitude=%s, home_latitude=%s, home_longitude=%s",
+                name,
+                latitude_old,
+                longitude_old,
+                latitude,
+                longitude,
+                self._home_latitude,
+                self._home_longitude,
+            )
+        # The attributes were written directly, without set_attr
+        self._attrs_dirty = True
         return proceed_with_update
 
     def finalize_last_place_name(self, prev_last_place_name=None):
+        name = self.get_attr(CONF_NAME)
         if self.get_attr(ATTR_INITIAL_UPDATE):
             self.set_attr(ATTR_LAST_PLACE_NAME, prev_last_place_name)
             _LOGGER.debug(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") Runnining initial update after load, using prior last_place_name"
+                "(%s) Runnining initial update after load, using prior last_place_name",
+                name,
             )
         elif self.get_attr(ATTR_LAST_PLACE_NAME) == self.get_attr(
             ATTR_PLACE_NAME
@@ -2616,87 +2439,71 @@ class Places(SensorEntity):
             # If current place name/zone are the same as previous, keep older last_place_name
             self.set_attr(ATTR_LAST_PLACE_NAME, prev_last_place_name)
             _LOGGER.debug(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") Initial last_place_name is same as new: place_name="
-                + str(self.get_attr(ATTR_PLACE_NAME))
-                + " or devicetracker_zone_name="
-                + str(self.get_attr(ATTR_DEVICETRACKER_ZONE_NAME))
-                + ", keeping previous last_place_name"
+                "(%s) Initial last_place_name is same as new: place_name=%s or devicetracker_zone_name=%s, keeping previous last_place_name",
+                name,
+                self.get_attr(ATTR_PLACE_NAME),
+                self.get_attr(ATTR_DEVICETRACKER_ZONE_NAME),
             )
         else:
-            _LOGGER.debug(
-                "(" + self.get_attr(CONF_NAME) + ") Keeping initial last_place_name"
-            )
+            _LOGGER.debug("(%s) Keeping initial last_place_name", name)
         _LOGGER.info(
-            "("
-            + self.get_attr(CONF_NAME)
-            + ") last_place_name: "
-            + str(self.get_attr(ATTR_LAST_PLACE_NAME))
+            "(%s) last_place_name: %s", name, self.get_attr(ATTR_LAST_PLACE_NAME)
         )
 
-    def do_update(self, reason):
+    async def do_update(self, reason):
         """Get the latest data and updates the states."""
 
-        now = datetime.now()
-        previous_attr = copy.deepcopy(self._internal_attr)
+        # The state listener and the scan interval can both start an update,
+        # run them one at a time so they don't interleave on the attributes
+        async with self._update_lock:
+            await self._do_update(reason)
 
-        _LOGGER.info("(" + self.get_attr(CONF_NAME) + ") Starting Update...")
+    async def _do_update(self, reason):
+        now = datetime.now()
+        # Used for both last_changed and last_updated
+        now_iso = now.isoformat(sep=" ", timespec="seconds")
+        # Attribute values are replaced rather than mutated, so a shallow copy
+        # is enough to revert to
+        previous_attr = dict(self._internal_attr)
+        self._in_zone_cache = None
+
+        _LOGGER.info("(%s) Starting Update...", self.get_attr(CONF_NAME))
         self.check_for_updated_entity_name()
         self.cleanup_attributes()
+        name = self.get_attr(CONF_NAME)
+        devicetracker_id = self.get_attr(CONF_DEVICETRACKER_ID)
+        native_value = self.get_attr(ATTR_NATIVE_VALUE)
+        latitude = self.get_attr(ATTR_LATITUDE)
+        longitude = self.get_attr(ATTR_LONGITUDE)
         # _LOGGER.debug(
         #    "("
         #    + self.get_attr(CONF_NAME)
         #    + ") Previous entity attributes: "
         #    + str(self._internal_attr)
         # )
-        if not self.is_attr_blank(ATTR_NATIVE_VALUE) and self.get_attr(CONF_SHOW_TIME):
-            self.set_attr(
-                ATTR_PREVIOUS_STATE, str(self.get_attr(ATTR_NATIVE_VALUE)[:-14])
-            )
+        if native_value is not None and self.get_attr(CONF_SHOW_TIME):
+            self.set_attr(ATTR_PREVIOUS_STATE, str(native_value[:-14]))
         else:
-            self.set_attr(ATTR_PREVIOUS_STATE, self.get_attr(ATTR_NATIVE_VALUE))
-        if self.is_float(self.get_attr(ATTR_LATITUDE)):
-            self.set_attr(ATTR_LATITUDE_OLD, str(self.get_attr(ATTR_LATITUDE)))
-        if self.is_float(self.get_attr(ATTR_LONGITUDE)):
-            self.set_attr(ATTR_LONGITUDE_OLD, str(self.get_attr(ATTR_LONGITUDE)))
+            self.set_attr(ATTR_PREVIOUS_STATE, native_value)
+        if self.is_float(latitude):
+            self.set_attr(ATTR_LATITUDE_OLD, float(latitude))
+        if self.is_float(longitude):
+            self.set_attr(ATTR_LONGITUDE_OLD, float(longitude))
         prev_last_place_name = self.get_attr(ATTR_LAST_PLACE_NAME)
 
         _LOGGER.info(
-            "("
-            + self.get_attr(CONF_NAME)
-            + ") Calling update for "
-            + str(self.get_attr(CONF_DEVICETRACKER_ID))
-            + " due to: "
-            + str(reason)
+            "(%s) Calling update for %s due to: %s", name, devicetracker_id, reason
         )
 
-        if self.is_float(
-            self._hass.states.get(self.get_attr(CONF_DEVICETRACKER_ID)).attributes.get(
-                CONF_LATITUDE
-            )
-        ):
-            self.set_attr(
-                ATTR_LATITUDE,
-                str(
-                    self._hass.states.get(
-                        self.get_attr(CONF_DEVICETRACKER_ID)
-                    ).attributes.get(CONF_LATITUDE)
-                ),
-            )
-        if self.is_float(
-            self._hass.states.get(self.get_attr(CONF_DEVICETRACKER_ID)).attributes.get(
-                CONF_LONGITUDE
-            )
-        ):
-            self.set_attr(
-                ATTR_LONGITUDE,
-                str(
-                    self._hass.states.get(
-                        self.get_attr(CONF_DEVICETRACKER_ID)
-                    ).attributes.get(CONF_LONGITUDE)
-                ),
-            )
+        devicetracker_attributes = getattr(
+            self._hass.states.get(devicetracker_id), "attributes", {}
+        )
+        new_latitude = devicetracker_attributes.get(CONF_LATITUDE)
+        if self.is_float(new_latitude):
+            self.set_attr(ATTR_LATITUDE, float(new_latitude))
+        new_longitude = devicetracker_attributes.get(CONF_LONGITUDE)
+        if self.is_float(new_longitude):
+            self.set_attr(ATTR_LONGITUDE, float(new_longitude))
 
         proceed_with_update = self.get_gps_accuracy()
         if proceed_with_update == 1:
@@ -2712,54 +2519,59 @@ class Places(SensorEntity):
         if proceed_with_update == 1 and not self.is_attr_blank(ATTR_DEVICETRACKER_ZONE):
             # 0: False. 1: True. 2: False, but set direction of travel to stationary
             _LOGGER.info(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") Meets criteria, proceeding with OpenStreetMap query"
+                "(%s) Meets criteria, proceeding with OpenStreetMap query", name
             )
 
             _LOGGER.info(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") DeviceTracker Zone: "
-                + str(self.get_attr(ATTR_DEVICETRACKER_ZONE))
-                # + " / Skipped Updates: "
-                # + str(self.get_attr(ATTR_UPDATES_SKIPPED))
+                "(%s) DeviceTracker Zone: %s",
+                name,
+                self.get_attr(ATTR_DEVICETRACKER_ZONE),
             )
 
             self._reset_attributes()
             self.get_map_link()
 
+            params = {
+                "format": "jsonv2",
+                "lat": self.get_attr(ATTR_LATITUDE),
+                "lon": self.get_attr(ATTR_LONGITUDE),
+                "addressdetails": 1,
+                "namedetails": 1,
+                "zoom": 18,
+                "limit": 1,
+            }
+            if not self.is_attr_blank(CONF_LANGUAGE):
+                params["accept-language"] = self.get_attr(CONF_LANGUAGE)
+            if not self.is_attr_blank(CONF_API_KEY):
+                params["email"] = self.get_attr(CONF_API_KEY)
             osm_url = (
-                "https://nominatim.openstreetmap.org/reverse?format=jsonv2&lat="
-                + str(self.get_attr(ATTR_LATITUDE))
-                + "&lon="
-                + str(self.get_attr(ATTR_LONGITUDE))
-                + (
-                    "&accept-language=" + str(self.get_attr(CONF_LANGUAGE))
-                    if not self.is_attr_blank(CONF_LANGUAGE)
-                    else ""
-                )
-                + "&addressdetails=1&namedetails=1&zoom=18&limit=1"
-                + (
-                    "&email=" + str(self.get_attr(CONF_API_KEY))
-                    if not self.is_attr_blank(CONF_API_KEY)
-                    else ""
-                )
+                "https://nominatim.openstreetmap.org/reverse?"
+                + urllib.parse.urlencode(params)
             )
 
-            self.set_attr(
-                ATTR_OSM_DICT, self.get_dict_from_url(osm_url, "OpenStreetMaps")
+            osm_dict = await self.get_cached_dict_from_url(
+                (
+                    "reverse",
+                    round(float(self.get_attr(ATTR_LATITUDE)), 5),
+                    round(float(self.get_attr(ATTR_LONGITUDE)), 5),
+                    self.get_attr(CONF_LANGUAGE),
+                ),
+                osm_url,
+                "OpenStreetMaps",
             )
+            if osm_dict and not self.get_attr(CONF_EXTENDED_ATTR):
+                # The full response is only exposed as an extended attribute
+                osm_dict = {k: v for k, v in osm_dict.items() if k in _OSM_DICT_KEYS}
+            self.set_attr(ATTR_OSM_DICT, osm_dict)
             if not self.is_attr_blank(ATTR_OSM_DICT):
 
                 self.parse_osm_dict()
                 self.finalize_last_place_name(prev_last_place_name)
 
+                options = self.get_attr(ATTR_DISPLAY_OPTIONS)
                 display_options = []
-                if not self.is_attr_blank(ATTR_DISPLAY_OPTIONS):
-                    options_array = self.get_attr(ATTR_DISPLAY_OPTIONS).split(",")
-                    for option in options_array:
-                        display_options.append(option.strip())
+                if options is not None:
+                    display_options = list(_parse_display_options(options))
                 self.set_attr(ATTR_DISPLAY_OPTIONS_LIST, display_options)
 
                 self.get_driving_status()
@@ -2770,16 +2582,12 @@ class Places(SensorEntity):
                         ATTR_NATIVE_VALUE, self.get_attr(ATTR_FORMATTED_PLACE)
                     )
                     _LOGGER.debug(
-                        "("
-                        + self.get_attr(CONF_NAME)
-                        + ") New State using formatted_place: "
-                        + str(self.get_attr(ATTR_NATIVE_VALUE))
+                        "(%s) New State using formatted_place: %s",
+                        name,
+                        self.get_attr(ATTR_NATIVE_VALUE),
                     )
                 elif not self.in_zone():
-                    if any(
-                        ext in self.get_attr(ATTR_DISPLAY_OPTIONS)
-                        for ext in ["(", ")", "[", "]"]
-                    ):
+                    if _ADV_OPTIONS_RE.search(options):
                         # Replace place option with expanded definition
                         # temp_opt = self.get_attr(ATTR_DISPLAY_OPTIONS)
                         # re.sub(
@@ -2795,20 +2603,14 @@ class Places(SensorEntity):
                         self.street_i = -1
                         self.temp_i = 0
                         _LOGGER.debug(
-                            "("
-                            + self.get_attr(CONF_NAME)
-                            + ") Initial Advanced Display Options: "
-                            + str(self.get_attr(ATTR_DISPLAY_OPTIONS))
+                            "(%s) Initial Advanced Display Options: %s", name, options
                         )
 
-                        self.build_from_advanced_options(
-                            self.get_attr(ATTR_DISPLAY_OPTIONS)
-                        )
+                        self.build_from_advanced_options(options)
                         _LOGGER.debug(
-                            "("
-                            + self.get_attr(CONF_NAME)
-                            + ") Back from initial advanced build: "
-                            + str(self.adv_options_state_list)
+                            "(%s) Back from initial advanced build: %s",
+                            name,
+                            self.adv_options_state_list,
                         )
                         self.compile_state_from_advanced_options()
                     else:
@@ -2821,50 +2623,41 @@ class Places(SensorEntity):
                         ATTR_NATIVE_VALUE, self.get_attr(ATTR_DEVICETRACKER_ZONE)
                     )
                     _LOGGER.debug(
-                        "("
-                        + self.get_attr(CONF_NAME)
-                        + ") New State from DeviceTracker Zone: "
-                        + str(self.get_attr(ATTR_NATIVE_VALUE))
+                        "(%s) New State from DeviceTracker Zone: %s",
+                        name,
+                        self.get_attr(ATTR_NATIVE_VALUE),
                     )
                 elif not self.is_attr_blank(ATTR_DEVICETRACKER_ZONE_NAME):
                     self.set_attr(
                         ATTR_NATIVE_VALUE, self.get_attr(ATTR_DEVICETRACKER_ZONE_NAME)
                     )
                     _LOGGER.debug(
-                        "("
-                        + self.get_attr(CONF_NAME)
-                        + ") New State from DeviceTracker Zone Name: "
-                        + str(self.get_attr(ATTR_NATIVE_VALUE))
+                        "(%s) New State from DeviceTracker Zone Name: %s",
+                        name,
+                        self.get_attr(ATTR_NATIVE_VALUE),
                     )
                 current_time = "%02d:%02d" % (now.hour, now.minute)
-                self.set_attr(
-                    ATTR_LAST_CHANGED, str(now.isoformat(sep=" ", timespec="seconds"))
-                )
+                self.set_attr(ATTR_LAST_CHANGED, now_iso)
 
                 # Final check to see if the New State is different from the Previous State and should update or not.
                 # If not, attributes are reset to what they were before the update started.
 
-                if (
-                    (
-                        not self.is_attr_blank(ATTR_PREVIOUS_STATE)
-                        and not self.is_attr_blank(ATTR_NATIVE_VALUE)
-                        and self.get_attr(ATTR_PREVIOUS_STATE).lower().strip()
-                        != self.get_attr(ATTR_NATIVE_VALUE).lower().strip()
-                        and self.get_attr(ATTR_PREVIOUS_STATE)
-                        .replace(" ", "")
-                        .lower()
-                        .strip()
-                        != self.get_attr(ATTR_NATIVE_VALUE).lower().strip()
-                        and self.get_attr(ATTR_PREVIOUS_STATE).lower().strip()
+                previous_state = self.get_attr(ATTR_PREVIOUS_STATE)
+                new_state = self.get_attr(ATTR_NATIVE_VALUE)
+                state_changed = previous_state is None or new_state is None
+                if not state_changed:
+                    previous_state = previous_state.lower().strip()
+                    new_state = new_state.lower().strip()
+                    state_changed = (
+                        previous_state != new_state
+                        and previous_state.replace(" ", "") != new_state
+                        and previous_state
                         != self.get_attr(ATTR_DEVICETRACKER_ZONE).lower().strip()
                     )
-                    or self.is_attr_blank(ATTR_PREVIOUS_STATE)
-                    or self.is_attr_blank(ATTR_NATIVE_VALUE)
-                    or self.get_attr(ATTR_INITIAL_UPDATE)
-                ):
+                if state_changed or self.get_attr(ATTR_INITIAL_UPDATE):
 
                     if self.get_attr(CONF_EXTENDED_ATTR):
-                        self.get_extended_attr()
+                        await self.get_extended_attr()
                     self.cleanup_attributes()
                     if not self.is_attr_blank(ATTR_NATIVE_VALUE):
                         if self.get_attr(CONF_SHOW_TIME):
@@ -2881,34 +2674,28 @@ class Places(SensorEntity):
                                 self.get_attr(ATTR_NATIVE_VALUE)[:255],
                             )
                         _LOGGER.info(
-                            "("
-                            + self.get_attr(CONF_NAME)
-                            + ") New State: "
-                            + str(self.get_attr(ATTR_NATIVE_VALUE))
+                            "(%s) New State: %s", name, self.get_attr(ATTR_NATIVE_VALUE)
                         )
                     else:
                         self.clear_attr(ATTR_NATIVE_VALUE)
-                        _LOGGER.warning(
-                            "(" + self.get_attr(CONF_NAME) + ") New State is None"
-                        )
+                        _LOGGER.warning("(%s) New State is None", name)
                     if not self.is_attr_blank(ATTR_NATIVE_VALUE):
                         self._attr_native_value = self.get_attr(ATTR_NATIVE_VALUE)
                     else:
                         self._attr_native_value = None
                     self.fire_event_data(prev_last_place_name)
                     self.set_attr(ATTR_INITIAL_UPDATE, False)
-                    self.write_sensor_to_json()
+                    await self.async_write_sensor_to_json()
                 else:
-                    self._internal_attr = previous_attr
+                    self._internal_attr.clear()
+                    self._internal_attr.update(previous_attr)
+                    self._attrs_dirty = True
                     _LOGGER.info(
-                        "("
-                        + self.get_attr(CONF_NAME)
-                        + ") No entity update needed, Previous State = New State"
+                        "(%s) No entity update needed, Previous State = New State", name
                     )
                     _LOGGER.debug(
-                        "("
-                        + self.get_attr(CONF_NAME)
-                        + ") Reverting attributes back to before the update started"
+                        "(%s) Reverting attributes back to before the update started",
+                        name,
                     )
 
                     changed_diff_sec = self.get_seconds_from_last_change(now)
@@ -2916,13 +2703,13 @@ class Places(SensorEntity):
                         self.get_attr(ATTR_DIRECTION_OF_TRAVEL) != "stationary"
                         and changed_diff_sec >= 60
                     ):
-                        self.change_dot_to_stationary(now, changed_diff_sec)
+                        await self.change_dot_to_stationary(now_iso, changed_diff_sec)
         else:
-            self._internal_attr = previous_attr
+            self._internal_attr.clear()
+            self._internal_attr.update(previous_attr)
+            self._attrs_dirty = True
             _LOGGER.debug(
-                "("
-                + self.get_attr(CONF_NAME)
-                + ") Reverting attributes back to before the update started"
+                "(%s) Reverting attributes back to before the update started", name
             )
 
             changed_diff_sec = self.get_seconds_from_last_change(now)
@@ -2932,59 +2719,60 @@ class Places(SensorEntity):
                 and changed_diff_sec >= 60
             ):
                 # 0: False. 1: True. 2: False, but set direction of travel to stationary
-                self.change_dot_to_stationary(now, changed_diff_sec)
+                await self.change_dot_to_stationary(now_iso, changed_diff_sec)
 
-        self.set_attr(
-            ATTR_LAST_UPDATED, str(now.isoformat(sep=" ", timespec="seconds"))
-        )
+        self.set_attr(ATTR_LAST_UPDATED, now_iso)
         # _LOGGER.debug(
         #    "("
         #    + self.get_attr(CONF_NAME)
         #    + ") Final entity attributes: "
         #    + str(self._internal_attr)
         # )
-        _LOGGER.info("(" + self.get_attr(CONF_NAME) + ") End of Update")
+        self._in_zone_cache = None
+        _LOGGER.info("(%s) End of Update", name)
 
-    def change_dot_to_stationary(self, now, changed_diff_sec):
+    async def change_dot_to_stationary(self, now_iso, changed_diff_sec):
         self.set_attr(ATTR_DIRECTION_OF_TRAVEL, "stationary")
-        self.set_attr(
-            ATTR_LAST_CHANGED, str(now.isoformat(sep=" ", timespec="seconds"))
-        )
-        self.write_sensor_to_json()
+        self.set_attr(ATTR_LAST_CHANGED, now_iso)
+        await self.async_write_sensor_to_json()
         _LOGGER.debug(
-            "("
-            + self.get_attr(CONF_NAME)
-            + ") Updating direction of travel to stationary (Last changed "
-            + str(int(changed_diff_sec))
-            + " seconds ago)"
+            "(%s) Updating direction of travel to stationary (Last changed %s seconds ago)",
+            self.get_attr(CONF_NAME),
+            int(changed_diff_sec),
         )
 
     def get_seconds_from_last_change(self, now):
-        try:
-            last_changed = datetime.fromisoformat(self.get_attr(ATTR_LAST_CHANGED))
-        except (TypeError, ValueError) as e:
-            _LOGGER.warning(
-                "Error converting Last Changed date/time ("
-                + str(self.get_attr(ATTR_LAST_CHANGED))
-                + ") into datetime: "
-                + str(repr(e))
-            )
-            return 3600
+        last_changed_str = self.get_attr(ATTR_LAST_CHANGED)
+        # Only parsed again once last_changed is written
+        if last_changed_str is not None and self._last_changed[0] == last_changed_str:
+            last_changed = self._last_changed[1]
         else:
             try:
-                changed_diff_sec = (now - last_changed).total_seconds()
-            except OverflowError as e:
+                last_changed = datetime.fromisoformat(last_changed_str)
+            except (TypeError, ValueError) as e:
                 _LOGGER.warning(
-                    "Error calculating the seconds between last change to now: "
-                    + str(repr(e))
+                    "Error converting Last Changed date/time (%s) into datetime: %s",
+                    last_changed_str,
+                    repr(e),
                 )
                 return 3600
-            else:
-                return changed_diff_sec
+            self._last_changed = (last_changed_str, last_changed)
+        try:
+            changed_diff_sec = (now - last_changed).total_seconds()
+        except OverflowError as e:
+            _LOGGER.warning(
+                "Error calculating the seconds between last change to now: %s",
+                repr(e),
+            )
+            return 3600
+        else:
+            return changed_diff_sec
 
     def _reset_attributes(self):
         """Resets attributes."""
+        pop = self._ia_pop
         for attr in RESET_ATTRIBUTE_LIST:
-            self.clear_attr(attr)
+            pop(attr, None)
+        self._attrs_dirty = True
         # self.set_attr(ATTR_UPDATES_SKIPPED, 0)
         self.cleanup_attributes()